@@ -0,0 +1,373 @@
+"""
+Benchmarks for the phone book pipeline using synthetic school data
+
+    python3 bench.py startup
+    python3 bench.py ingest --classes 100
+    python3 bench.py pagefit
+    python3 bench.py render --jobs 1 2 4
+    python3 bench.py shards --jobs 1 2 4
+    python3 bench.py save --compression store fast default max
+    python3 bench.py contacts --classes 100
+    python3 bench.py index --students 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+
+FIRST_NAMES = ['ADA', 'BEN', 'CARA', 'DAN', 'EVE', 'FINN', 'GUS', 'HAL', 'IVY', 'JO', 'KAI', 'LEO',
+               'MIA', 'NED', 'OLA', 'PIA', 'RJ', 'SAM', 'TIA', 'UMA', 'VIC', 'WES', 'ZOE']
+LAST_NAMES = ['ADAMS', 'BAKER', 'CLARK', 'DAVIS', 'EVANS', 'FOX', 'GRAY', 'HILL', 'IRWIN', 'JONES',
+              'KING', 'LEE', 'MCDONALD', 'NASH', 'OWEN', 'PARK', 'QUINN', 'ROSS', 'SMITH', 'TATE',
+              'UPTON', 'VANCE', 'WEST', 'YOUNG', 'ZANE']
+PARENT_HEADERS = ['Full name (LF)', 'Grade', 'Homeroom Teacher', 'Info to Share', 'Guardian Name', 'Email']
+
+
+def synthetic_rows(num_classes, class_size=22, seed=44):
+    """
+    Returns the class list sheets and the rows of the three parent files
+    laid out like the files from the school
+    """
+    rng = random.Random(seed)
+    classes = []
+    parent_rows = [
+            [PARENT_HEADERS + ['Guardian Name', 'Email', 'Phone']],
+            [PARENT_HEADERS + ['Phone', 'Guardian Name', 'Email', 'Phone']],
+            [PARENT_HEADERS + ['Phone', 'Address', 'City', 'Zip', 'Guardian Name', 'Email', 'Phone']],
+            ]
+    families = []
+
+    for c in range(num_classes):
+        grade = c % 6
+        last_name = f"T{c:03d}X"
+        class_rows = [
+                [f"Teacher: {last_name}", 'K' if grade == 0 else f"{grade}TH", f"ROOM # {100 + c}"],
+                [],
+                ['STUDENT NAME'],
+                ]
+
+        names = set()
+        while len(names) < class_size:
+            names.add(f"{rng.choice(LAST_NAMES)}, {rng.choice(FIRST_NAMES)}{rng.randint(0, 99)}")
+
+        for name in sorted(names):
+            class_rows.append([name])
+            family_name = name.split(',')[0]
+            # Some students are siblings of students in other classes
+            if families and rng.random() < 0.3:
+                family = rng.choice(families)
+            else:
+                family = (f"{rng.choice(FIRST_NAMES)} {family_name}",
+                          f"{family_name.lower()}{rng.randint(0, 9999)}@example.com",
+                          f"630-555-{rng.randint(1000, 9999)}",
+                          f"{rng.randint(1, 999)} Main St Lombard, IL 60148",
+                          f"{rng.choice(FIRST_NAMES)} {family_name}",
+                          f"{family_name.lower()}{rng.randint(0, 9999)}@example.com",
+                          f"630-555-{rng.randint(1000, 9999)}")
+                families.append(family)
+
+            email = family[1].upper() if rng.random() < 0.3 else family[1]
+            row = [name, 'K' if grade == 0 else grade, f"MS {last_name}", 'Info', family[0], email]
+            match rng.randrange(3):
+                case 0: parent_rows[0].append(row + [family[4], family[5], None])
+                case 1: parent_rows[1].append(row + [family[2], family[4], family[5], family[6]])
+                case 2: parent_rows[2].append(row + [family[2], family[3], 'Lombard', '60148', family[4], family[5], family[6]])
+
+        class_rows.append([f"Total: {class_size}"])
+        classes.append((last_name, class_rows))
+
+    return classes, parent_rows
+
+
+def synthetic_data(num_classes, class_size=22):
+    """
+    Returns the merged data for synthetic files without writing them out
+    """
+    from phonebook.parsers import ParentColumns
+    from phonebook.pipeline import build_data
+
+    classes, parent_rows = synthetic_rows(num_classes, class_size)
+    parent_file_fields = []
+    for rows in parent_rows:
+        columns = ParentColumns(rows[0])
+        parent_file_fields.append([columns.fields(row) for row in rows[1:]])
+
+    return build_data(classes, parent_file_fields)
+
+
+def write_synthetic_data(directory, num_classes, class_size=22, parent_format='xlsx'):
+    """
+    Writes a synthetic class list and parent files and returns the paths. The
+    class list is always XLSX while the parent files can be XLSX, CSV or Parquet.
+    """
+    import csv
+    import openpyxl
+
+    classes, parent_rows = synthetic_rows(num_classes, class_size)
+
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for title, rows in classes:
+        ws = wb.create_sheet(title=title)
+        for row in rows:
+            ws.append(row)
+    class_list = os.path.join(directory, 'class-list.xlsx')
+    wb.save(class_list)
+
+    parent_files = []
+    for i, rows in enumerate(parent_rows):
+        path = os.path.join(directory, f"parents-{i + 1}.{parent_format}")
+        if parent_format == 'csv':
+            with open(path, 'w', newline='') as csv_file:
+                csv.writer(csv_file).writerows(rows)
+        elif parent_format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            # Written column by column since the guardian headers repeat
+            columns = [pa.array([None if v is None else str(v) for v in column], type=pa.string()) for column in zip(*rows[1:])]
+            pq.write_table(pa.Table.from_arrays(columns, names=rows[0]), path)
+        else:
+            wb = openpyxl.Workbook()
+            for row in rows:
+                wb.active.append(row)
+            wb.save(path)
+        parent_files.append(path)
+
+    return class_list, parent_files
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(name, seconds, extra=''):
+    print(f"{name:40} {seconds * 1000:10.1f} ms {extra}")
+
+
+def bench_startup(args):
+    import_py = str(Path(__file__).resolve().parent / 'import.py')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        class_list, parent_files = write_synthetic_data(tmp, num_classes=1, class_size=1)
+        inputs = ['--class-list', class_list, '--parent-files', *parent_files]
+        commands = {
+                'import phonebook': [sys.executable, '-c', 'import phonebook'],
+                'import.py --help': [sys.executable, import_py, '--help'],
+                'import.py --format text': [sys.executable, import_py, *inputs, '--format', 'text'],
+                'import.py --format excel': [sys.executable, import_py, *inputs, '--output', os.path.join(tmp, 'out.xlsx')],
+                }
+        report('python (baseline)', best_of(args.repeat, lambda: subprocess.run([sys.executable, '-c', 'pass'], check=True)))
+        for name, command in commands.items():
+            run = lambda: subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            report(name, best_of(args.repeat, run))
+
+
+def bench_ingest(args):
+    from importlib.util import find_spec
+    from phonebook.parsers import ParentParser
+
+    parent_formats = ['xlsx', 'csv']
+    if find_spec('pyarrow'):
+        parent_formats.append('parquet')
+
+    expected = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for parent_format in parent_formats:
+            directory = os.path.join(tmp, parent_format)
+            os.mkdir(directory)
+            _, parent_files = write_synthetic_data(directory, args.classes, parent_format=parent_format)
+
+            students = []
+            seconds = best_of(args.repeat, lambda: students.append(ParentParser.parse_parent_students(parent_files)))
+            report(f"parse parent files ({parent_format})", seconds, f"{len(students[-1]) / seconds:10.0f} rows/s")
+
+            # Every format has to read the same rows as the XLSX files
+            parsed = [str(s) for s in students[-1]]
+            if expected is None:
+                expected = parsed
+            elif parsed != expected:
+                raise SystemExit(f"ERROR: The {parent_format} parent files were read differently than the xlsx files")
+
+
+def bench_pagefit(args):
+    from phonebook.pagefit import PageFitter
+
+    data = synthetic_data(args.classes)
+    fitter = PageFitter()
+
+    seconds = best_of(args.repeat, lambda: [fitter.fit(c) for c in data.class_lists])
+    report('fit class sheets', seconds, f"{seconds / len(data.class_lists) * 1e6:10.1f} us/sheet")
+
+
+def bench_render(args):
+    from phonebook.pipeline import create_output, render
+
+    data = synthetic_data(args.classes)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'out.xlsx')
+        serial = best_of(args.repeat, lambda: render(data, [create_output(data, 'excel', output)]))
+        report('render serial', serial)
+        for jobs in args.jobs:
+            seconds = best_of(args.repeat, lambda: render(data, [create_output(data, 'excel', output, workers=jobs)]))
+            report(f"render --jobs {jobs}", seconds, f"{serial / seconds:6.2f}x")
+
+
+def bench_shards(args):
+    from phonebook.pipeline import create_output, render
+
+    data = synthetic_data(args.classes)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'out.xlsx')
+        single = best_of(args.repeat, lambda: render(data, [create_output(data, 'excel', output)]))
+        report('render one book', single)
+
+        directory = os.path.join(tmp, 'shards')
+        for jobs in [None, *args.jobs]:
+            seconds = best_of(args.repeat, lambda: render(data, [create_output(data, 'shards', directory, workers=jobs)]))
+            report(f"render {len(data.class_lists)} class books" + (f" --jobs {jobs}" if jobs else ''), seconds, f"{single / seconds:6.2f}x")
+
+
+def bench_save(args):
+    import zipfile
+    from phonebook.pipeline import create_output, render
+
+    data = synthetic_data(args.classes)
+    output = create_output(data, 'excel')
+    # Build the whole workbook but leave saving it to the timings below
+    output.save = lambda: None
+    render(data, [output])
+
+    serialize = best_of(args.repeat, output.serialize)
+    report('serialize workbook', serialize)
+
+    archive = output.serialize()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'out.xlsx')
+
+        def save_zipfile():
+            # How openpyxl writes the package
+            with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+                for name, part in archive.parts.items():
+                    z.writestr(name, part)
+        report('compress with zipfile', best_of(args.repeat, save_zipfile), f"{os.path.getsize(path) / 1024:10.0f} KiB")
+
+        for compression in args.compression:
+            for workers in args.threads:
+                size = []
+                seconds = best_of(args.repeat, lambda: size.append(archive.save(path, compression, workers)))
+                report(f"compress {compression} ({workers} threads)", seconds, f"{size[-1] / 1024:10.0f} KiB")
+
+
+def bench_contacts(args):
+    from phonebook.contacts import normalize_contacts
+    from phonebook.model import Guardian
+
+    data = synthetic_data(args.classes)
+    merge = best_of(args.repeat, lambda: synthetic_data(args.classes))
+    guardians = list(data.households.guardians)
+
+    # Spell the phones the different ways people type them and break some emails
+    formats = ['{}-{}-{}', '({}) {}-{}', '{}.{}.{}', '1 {} {} {}']
+    contacts = []
+    for i, g in enumerate(guardians):
+        phone = g.phone and formats[i % len(formats)].format(*g.phone.split('-'))
+        email = g.email.replace('@', ' at ') if i % 50 == 0 else g.email.upper()
+        contacts.append((g.name, email, phone, g.address and f"{g.address}, Lombard, IL 60148"))
+
+    timings = []
+    for _ in range(args.repeat):
+        batch = [Guardian(*c) for c in contacts]
+        start = time.perf_counter()
+        problems = normalize_contacts(batch)
+        timings.append(time.perf_counter() - start)
+    seconds = min(timings)
+    report(f"normalize {len(contacts)} guardians", seconds, f"{len(contacts) / seconds:10.0f} guardians/s, {len(problems)} problems")
+    report('generate and merge the parent files', merge, f"{seconds / merge * 100:9.1f}% of it normalizing")
+
+
+def synthetic_index_entries(num_students, seed=44):
+    from phonebook.index import IndexEntry
+
+    rng = random.Random(seed)
+    for i in range(num_students):
+        name = f"{rng.choice(LAST_NAMES)}, {rng.choice(FIRST_NAMES)}{rng.randint(0, 99)}"
+        yield IndexEntry(name, i, name.title(), str(rng.randint(0, 5)), f"T{i // 22:05d}X")
+
+
+def bench_index(args):
+    import tracemalloc
+    from itertools import groupby
+    from phonebook.index import external_sort
+
+    def in_memory(entries):
+        return sorted(entries)
+
+    for num_students in args.students:
+        for name, sort in [('in memory', in_memory), (f"runs of {args.run_size}", lambda e: external_sort(e, args.run_size))]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            students = sum(1 for _, group in groupby(sort(synthetic_index_entries(num_students)), key=lambda e: e.name[0]) for _ in group)
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            report(f"sort {num_students} students {name}", seconds, f"{peak / 2**20:8.1f} MiB peak")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='bench.py')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of runs to take the best time from')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    subparsers.add_parser('startup', help='time the CLI startup for each command').set_defaults(fn=bench_startup)
+
+    ingest = subparsers.add_parser('ingest', help='compare parsing the parent files as XLSX and CSV')
+    ingest.add_argument('--classes', type=int, default=100, help='the number of synthetic classes')
+    ingest.set_defaults(fn=bench_ingest)
+
+    pagefit = subparsers.add_parser('pagefit', help='time predicting whether each class sheet fits on a page')
+    pagefit.add_argument('--classes', type=int, default=100, help='the number of synthetic classes')
+    pagefit.set_defaults(fn=bench_pagefit)
+
+    render = subparsers.add_parser('render', help='compare rendering the workbook serially and in worker processes')
+    render.add_argument('--classes', type=int, default=100, help='the number of synthetic classes')
+    render.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4], help='the worker counts to try')
+    render.set_defaults(fn=bench_render)
+
+    shards = subparsers.add_parser('shards', help='compare rendering one book with a book for each class')
+    shards.add_argument('--classes', type=int, default=50, help='the number of synthetic classes')
+    shards.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4], help='the worker counts to try')
+    shards.set_defaults(fn=bench_shards)
+
+    save = subparsers.add_parser('save', help='time writing the workbook with each compression level')
+    save.add_argument('--classes', type=int, default=100, help='the number of synthetic classes')
+    save.add_argument('--compression', nargs='+', default=['store', 'fast', 'default', 'max'], help='the compression levels to try')
+    save.add_argument('--threads', type=int, nargs='+', default=[1, 4], help='the compression thread counts to try')
+    save.set_defaults(fn=bench_save)
+
+    contacts = subparsers.add_parser('contacts', help='time normalizing and validating the guardian contact fields')
+    contacts.add_argument('--classes', type=int, default=100, help='the number of synthetic classes')
+    contacts.set_defaults(fn=bench_contacts)
+
+    index = subparsers.add_parser('index', help='compare the memory used sorting the student index in memory and in runs')
+    index.add_argument('--students', type=int, nargs='+', default=[10000, 100000, 1000000], help='the numbers of students to sort')
+    index.add_argument('--run-size', type=int, default=10000, help='the number of students sorted in memory at a time')
+    index.set_defaults(fn=bench_index)
+
+    args = parser.parse_args(argv)
+    args.fn(args)
+
+
+if __name__ == '__main__':
+    main()
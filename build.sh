@@ -1,10 +1,22 @@
 #!/usr/bin/env bash
 
+# Stop at the first step that fails rather than building from its missing output
+set -e
+
 cd "$(dirname "$0")"
 
 data_pdf="${1?Must specify data PDF as first argument}"
 output_pdf="${2?Must specify output PDF as second argument}"
 
+# Record a fixed date in the PDFs so the same inputs give the same files
+export SOURCE_DATE_EPOCH="${SOURCE_DATE_EPOCH:-315532800}"
+
+# Steps whose inputs have not changed are copied from the store instead of run
+store="${PHONEBOOK_STORE:-.phonebook-store}"
+cached() {
+  python3 -m phonebook.store --store "$store" "$@"
+}
+
 rm -rf tmp
 mkdir -p tmp
 
@@ -22,15 +34,18 @@ for img in \
   ; do
   echo "Converting $img to PDF..."
   b="$(basename "$img" .jpg)"
-  img2pdf --pagesize Letter "$img" -o tmp/"$b".pdf;
+  cached --input "$img" --output tmp/"$b".pdf -- \
+    img2pdf --pagesize Letter "$img" -o tmp/"$b".pdf
 done
 
 # Write the PDF
+pages=(
+  tmp/front-cover.pdf
+  tmp/front-inside-cover.pdf
+  "$data_pdf"
+  tmp/back-inside-cover.pdf
+  tmp/back-cover.pdf
+)
 set -x
-pdfunite \
-  tmp/front-cover.pdf \
-  tmp/front-inside-cover.pdf \
-  "$data_pdf" \
-  tmp/back-inside-cover.pdf \
-  tmp/back-cover.pdf \
-  "$output_pdf"
+cached "${pages[@]/#/--input=}" --output "$output_pdf" -- \
+  pdfunite "${pages[@]}" "$output_pdf"
@@ -0,0 +1,3 @@
+from phonebook.model import AllData, Class, Grade, Guardian, Household, Households, Student, Teacher, fix_name
+from phonebook.parsers import ClassListParser, ParentParser
+from phonebook.pipeline import create_output, load_data, render
@@ -0,0 +1,120 @@
+"""
+Writes the workbook zip package with the parts compressed concurrently.
+
+openpyxl writes each part into a ZipFile which compresses them one after
+another. Instead the parts are collected in memory, deflated on a thread
+pool (zlib releases the GIL while it compresses) and then written out with
+the zip headers built here.
+"""
+import datetime
+import os
+import struct
+import time
+import zlib
+
+
+COMPRESSION_LEVELS = {
+        'store': None,
+        'fast': 1,
+        'default': 6,
+        'max': 9,
+        }
+
+STORED = 0
+DEFLATED = 8
+VERSION = 20
+# Read and write for the owner, the same as ZipFile.writestr
+EXTERNAL_ATTRIBUTES = 0o600 << 16
+ZIP32_LIMIT = 0xFFFFFFFF
+# 1980-01-01, the earliest time a zip file can record
+ZIP_EPOCH = 315532800
+
+
+def build_time():
+    """
+    Returns the time recorded in the output so building the same data twice
+    gives the same file. Set SOURCE_DATE_EPOCH to record a different time.
+    """
+    epoch = int(os.environ.get('SOURCE_DATE_EPOCH', ZIP_EPOCH))
+    return datetime.datetime.fromtimestamp(epoch, tz=datetime.timezone.utc).replace(tzinfo=None)
+
+
+def dos_date_time(date_time):
+    year, month, day, hour, minute, second = date_time[:6]
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def compress(data, level):
+    if level is None:
+        return STORED, data
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return DEFLATED, compressor.compress(data) + compressor.flush()
+
+
+class Archive:
+    """
+    Collects the parts of a workbook in memory in the order they are written.
+    Implements the part of the ZipFile interface that openpyxl's ExcelWriter uses.
+    """
+
+    def __init__(self):
+        self.parts = {}
+
+    def writestr(self, name, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self.parts[name] = data
+
+    def write(self, filename, arcname):
+        with open(filename, 'rb') as f:
+            self.parts[arcname] = f.read()
+
+    def namelist(self):
+        return list(self.parts)
+
+    def close(self):
+        pass
+
+    def save(self, path, compression='default', workers=None, date_time=None):
+        """
+        Compresses the parts concurrently and writes the zip file. Returns the size of the file.
+        """
+        # Imported here to keep them out of the CLI startup
+        import zipfile
+        from concurrent.futures import ThreadPoolExecutor
+
+        level = COMPRESSION_LEVELS[compression]
+        dos_time, dos_date = dos_date_time(date_time or time.localtime())
+
+        names = list(self.parts)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            crcs = pool.map(zlib.crc32, [self.parts[n] for n in names])
+            compressed = pool.map(lambda n: compress(self.parts[n], level), names)
+            entries = list(zip(names, crcs, compressed))
+
+        central_directory = []
+        offset = 0
+        with open(path, 'wb') as f:
+            for name, crc, (method, data) in entries:
+                encoded_name = name.encode('utf-8')
+                # Bit 11 marks the name as UTF-8
+                flags = 0 if encoded_name.isascii() else 0x800
+                size = len(self.parts[name])
+                if max(offset, size, len(data)) > ZIP32_LIMIT:
+                    raise ValueError(f"{name} is too large to write without zip64")
+
+                f.write(struct.pack(zipfile.structFileHeader, zipfile.stringFileHeader,
+                        VERSION, 0, flags, method, dos_time, dos_date, crc, len(data), size, len(encoded_name), 0))
+                f.write(encoded_name)
+                f.write(data)
+
+                central_directory.append(struct.pack(zipfile.structCentralDir, zipfile.stringCentralDir,
+                        VERSION, 0, VERSION, 0, flags, method, dos_time, dos_date, crc, len(data), size,
+                        len(encoded_name), 0, 0, 0, 0, EXTERNAL_ATTRIBUTES, offset) + encoded_name)
+                offset = f.tell()
+
+            directory = b''.join(central_directory)
+            f.write(directory)
+            f.write(struct.pack(zipfile.structEndArchive, zipfile.stringEndArchive,
+                    0, 0, len(entries), len(entries), len(directory), offset, 0))
+            return f.tell()
@@ -0,0 +1,63 @@
+import argparse
+
+from phonebook.archive import COMPRESSION_LEVELS
+from phonebook.pipeline import create_output, load_data, render
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='import.py', usage='%(prog)s [options]')
+    parser.add_argument('--output', help='the output file path, or the directory for the shards format')
+    parser.add_argument('--parent-files', nargs='+', required=True, help='the parent directory files')
+    parser.add_argument('--class-list', required=True, help='the class list file')
+    parser.add_argument('--format', choices=['excel', 'shards', 'text'], default='excel',
+                        help='the output format, where shards writes a workbook for each class')
+    parser.add_argument('--jobs', type=int, help='render the class sheets in this many worker processes')
+    parser.add_argument('--compression', choices=COMPRESSION_LEVELS, default='default',
+                        help='how hard to compress the excel output, from store (none) to max')
+    parser.add_argument('--store', help='reuse the output from this artifact store when the inputs have not changed')
+    parser.add_argument('--watch', action='store_true', help='rebuild the output whenever an input file changes')
+
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.format in ['excel', 'shards'] and not args.output:
+        parser.error(f"--output is required for the {args.format} format")
+    if args.store and args.format != 'excel':
+        parser.error('--store only applies to the excel format')
+    if args.store and args.watch:
+        parser.error('--store cannot be used with --watch')
+
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.watch:
+        from phonebook.watch import Watcher
+
+        try:
+            Watcher(args.class_list, args.parent_files, args.format, args.output, args.jobs, args.compression).run()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.store:
+        import os
+        from importlib.metadata import version
+        from phonebook.store import SOURCE_FILES, ArtifactStore
+
+        # The number of jobs is left out since it does not change the workbook
+        settings = {'format': args.format, 'compression': args.compression, 'output': args.output,
+                    'openpyxl': version('openpyxl'), 'source_date_epoch': os.environ.get('SOURCE_DATE_EPOCH')}
+        ArtifactStore(args.store).build([args.class_list, *args.parent_files, *SOURCE_FILES], settings, [args.output],
+                lambda: build(args))
+    else:
+        build(args)
+
+    return 0
+
+
+def build(args):
+    data = load_data(args.class_list, args.parent_files)
+    render(data, [create_output(data, args.format, args.output, args.jobs, args.compression)])
@@ -0,0 +1,101 @@
+"""
+Cleans up the contact fields of every guardian in one pass once the parent
+files are merged, and reports whatever could not be fixed so it can be
+corrected in the parent files before the book is printed.
+"""
+import re
+
+from collections import namedtuple
+
+
+EMAIL = re.compile(r"[^@\s,;]+@[^@\s,;]+\.[a-z]{2,}")
+MAILTO = re.compile(r"^mailto:", re.IGNORECASE)
+NON_DIGITS = re.compile(r"\D")
+EXTENSION = re.compile(r"\s*(?:x|ext\.?|extension)\s*(\d+)\s*$", re.IGNORECASE)
+# Everyone lives in Lombard so only the street is printed
+LOCAL_ADDRESS = re.compile(r",?\s*Lombard,?\s+IL,?\s+60148(?:-\d{4})?", re.IGNORECASE)
+# title() turns 1st into 1St
+ORDINAL = re.compile(r"\b(\d+)(St|Nd|Rd|Th)\b")
+SPACES = re.compile(r"\s+")
+TRAILING = re.compile(r"[\s,.]+$")
+
+Problem = namedtuple('Problem', ['guardian', 'field', 'value', 'message'])
+
+
+def normalize_email(email):
+    """
+    Returns the email in lowercase and a message when it is not valid
+    """
+    if email is None:
+        return None, None
+
+    email = MAILTO.sub('', str(email).strip()).lower()
+    if not email:
+        return None, None
+    if not EMAIL.fullmatch(email):
+        return email, 'is not a valid email address'
+    return email, None
+
+
+def normalize_phone(phone):
+    """
+    Returns the phone number as 630-555-1234 and a message when it cannot be
+    """
+    if phone is None:
+        return None, None
+
+    # Numbers read from a spreadsheet may be floats
+    if isinstance(phone, float) and phone.is_integer():
+        phone = int(phone)
+    phone = str(phone).strip()
+    if not phone:
+        return None, None
+
+    extension = EXTENSION.search(phone)
+    digits = NON_DIGITS.sub('', phone[:extension.start()] if extension else phone)
+    if len(digits) == 11 and digits[0] == '1':
+        digits = digits[1:]
+    if len(digits) != 10:
+        return phone, 'is not a 10 digit phone number'
+
+    phone = f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+    if extension:
+        phone += f" x{extension.group(1)}"
+    return phone, None
+
+
+def normalize_address(address):
+    if address is None:
+        return None
+
+    address = LOCAL_ADDRESS.sub('', SPACES.sub(' ', str(address)).title())
+    address = TRAILING.sub('', ORDINAL.sub(lambda m: m.group(1) + m.group(2).lower(), address)).strip()
+    return address or None
+
+
+def normalize_contacts(guardians):
+    """
+    Normalizes the email, phone and address of each guardian in place and
+    returns the problems found
+    """
+    problems = []
+    for g in guardians:
+        g.email, message = normalize_email(g.email)
+        if message:
+            problems.append(Problem(g, 'email', g.email, message))
+
+        g.phone, message = normalize_phone(g.phone)
+        if message:
+            problems.append(Problem(g, 'phone', g.phone, message))
+
+        g.address = normalize_address(g.address)
+        if g.household:
+            g.household.invalidate()
+
+    return problems
+
+
+def report_problems(problems):
+    if problems:
+        print(f"WARNING: Found {len(problems)} problems with the contact information in the parent files")
+        print("\n".join(f"{p.guardian.title()}: {p.field} '{p.value}' {p.message}" for p in problems))
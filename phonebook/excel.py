@@ -0,0 +1,622 @@
+import openpyxl
+
+from copy import copy
+from pathlib import Path
+from openpyxl.drawing.image import Image
+from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.styles import DEFAULT_FONT, Alignment, Border, Font, NamedStyle, Side
+from phonebook.pagefit import PageFitter
+
+
+YEAR = '2025-2026'
+IMAGES_DIR = Path(__file__).resolve().parent.parent / 'images'
+artists = {
+        'front':        ['Cadence MacDougall', '5th grade'],
+        'front inside': ['Patrick Riehman', '3rd grade'],
+        'back inside':  ['Olivia Stelle', '4th grade'],
+        'back':         ['Mabel McCahill', '4th grade'],
+        }
+
+
+class ExcelOutput:
+
+    hyperlink_font = Font(name='Arial', underline='single', size=10, color='3366FF')
+
+    @staticmethod
+    def google_width(num):
+        return num / 7
+
+    def __init__(self, data, output, workers=None, pages=True, compression='default'):
+        self.wb = openpyxl.Workbook()
+
+        self.data = data
+        self.output = output
+        self.compression = compression
+        self.fitter = PageFitter()
+        # Class sheets rendered in worker processes by title, in sheet order
+        self.workers = workers
+        self.pool = None
+        self.parts = {}
+
+        DEFAULT_FONT.name = 'Arial'
+        DEFAULT_FONT.size = 10
+        medium_border = Side(border_style='medium', color='000000')
+        self.medium_border = medium_border
+        thin_border = Side(border_style='thin', color='000000')
+        self.thin_border = thin_border
+
+        heading = NamedStyle(name='heading')
+        heading.alignment = Alignment(horizontal='center', vertical='center')
+        heading.font = Font(name='Arial', bold=True, size=12)
+        self.wb.add_named_style(heading)
+
+        subheading = NamedStyle(name='subheading')
+        subheading.alignment = Alignment(horizontal='center', vertical='center')
+        subheading.font = Font(name='Arial', bold=True, size=11)
+        self.wb.add_named_style(subheading)
+
+        tableheading = NamedStyle(name='tableheading')
+        tableheading.font = Font(name='Arial', bold=True, size=9)
+        tableheading.border = Border(top=medium_border, bottom=medium_border)
+        self.wb.add_named_style(tableheading)
+
+        tableheadingbegin = NamedStyle(name='tableheadingbegin')
+        tableheadingbegin.font = Font(name='Arial', bold=True, size=9)
+        tableheadingbegin.border = Border(top=medium_border, bottom=medium_border, left=medium_border)
+        self.wb.add_named_style(tableheadingbegin)
+
+        tableheadingend = NamedStyle(name='tableheadingend')
+        tableheadingend.font = Font(name='Arial', bold=True, size=9)
+        tableheadingend.border = Border(top=medium_border, bottom=medium_border, right=medium_border)
+        self.wb.add_named_style(tableheadingend)
+
+        student = NamedStyle(name='student')
+        student.font = Font(name='Arial', bold=True, size=11)
+        student.border = Border(left=thin_border)
+        self.wb.add_named_style(student)
+
+        studentend = NamedStyle(name='studentend')
+        studentend.border = Border(right=thin_border)
+        self.wb.add_named_style(studentend)
+
+        indexletter = NamedStyle(name='indexletter')
+        indexletter.alignment = Alignment(horizontal='center', vertical='bottom')
+        indexletter.font = Font(name='Arial', bold=True, size=9)
+        self.wb.add_named_style(indexletter)
+
+        indexstudent = NamedStyle(name='indexstudent')
+        indexstudent.font = Font(name='Arial', size=10)
+        indexstudent.border = Border(top=thin_border, right=thin_border, bottom=thin_border, left=thin_border)
+        self.wb.add_named_style(indexstudent)
+
+        if pages:
+            self.create_welcome()
+            # The links in the TOC are not preserved when sheets exports as PDF
+            # self.create_toc()
+            self.create_staff()
+
+    def create_welcome(self):
+        ws = self.wb.create_sheet(title='Welcome')
+        margins = ws.page_margins
+        margins.left = margins.right = margins.bottom = 0.25
+        margins.top = 0.5
+
+        ws.column_dimensions['A'].width = 97
+
+        ws['A2'] = 'PTA PHONE BOOK'
+        ws['A2'].font = Font(name='Arial', bold=True, size=24)
+        ws['A2'].alignment = Alignment(horizontal='center')
+
+        ws['A3'] = YEAR
+        ws['A3'].font = Font(name='Arial', bold=True, size=14)
+        ws['A3'].alignment = Alignment(horizontal='center')
+
+        ws['A6'] = 'WILLIAM HAMMERSCHMIDT SCHOOL'
+        ws['A6'].font = Font(name='Arial', bold=True, size=20)
+        ws['A6'].alignment = Alignment(horizontal='center')
+
+        ws['A7'] = '617 Hammerschmidt Avenue'
+        ws['A7'].font = Font(name='Arial', size=14)
+        ws['A7'].alignment = Alignment(horizontal='center')
+
+        ws['A8'] = 'Lombard, IL 60148'
+        ws['A8'].font = Font(name='Arial', size=14)
+        ws['A8'].alignment = Alignment(horizontal='center')
+
+        ws['A11'] = 'Phone: 630-827-4200    Fax: 630-620-3733'
+        ws['A11'].font = Font(name='Arial', size=14)
+        ws['A11'].alignment = Alignment(horizontal='center')
+
+        ws['A12'] = 'Voicemail / Attendance: 630-827-4201'
+        ws['A12'].font = Font(name='Arial', size=14)
+        ws['A12'].alignment = Alignment(horizontal='center')
+
+        big_link = copy(self.hyperlink_font)
+        big_link.size = 14
+
+        ws['A13'] = '=hyperlink("https://wh.sd44.org")'
+        ws['A13'].font = big_link
+        ws['A13'].alignment = Alignment(horizontal='center')
+
+        ws['A15'] = 'School District 44'
+        ws['A15'].font = Font(name='Arial', size=14)
+        ws['A15'].alignment = Alignment(horizontal='center')
+
+        ws['A16'] = '=hyperlink("https://www.sd44.org")'
+        ws['A16'].font = big_link
+        ws['A16'].alignment = Alignment(horizontal='center')
+
+        # ws['A19'] = 'Mr. David Danielski'
+        # ws['A19'].font = Font(name='Arial', size=14)
+        # ws['A19'].alignment = Alignment(horizontal='center')
+
+        # ws['A20'] = 'PRINCIPAL'
+        # ws['A20'].font = Font(name='Arial', size=14)
+        # ws['A20'].alignment = Alignment(horizontal='center')
+
+        # ws['A22'] = 'Ms. Liz Valdivia'
+        # ws['A22'].font = Font(name='Arial', size=14)
+        # ws['A22'].alignment = Alignment(horizontal='center')
+
+        # ws['A23'] = 'SECRETARY'
+        # ws['A23'].font = Font(name='Arial', size=14)
+        # ws['A23'].alignment = Alignment(horizontal='center')
+
+        ws['A33'] = "THIS PTA PHONE BOOK IS FOR PARENT AND STUDENT USE ONLY,\nNOT FOR COMMERCIAL USE."
+        ws['A33'].font = Font(name='Arial', size=14)
+        ws['A33'].alignment = Alignment(horizontal='center', wrapText=True)
+
+        ws['A35'] = 'This Phone Book is sponsored by the WHS PTA and is issued free, one per member family.'
+        ws['A35'].font = Font(name='Arial', size=12)
+        ws['A35'].alignment = Alignment(horizontal='center')
+
+    def create_toc(self):
+        ws = self.wb.create_sheet(title='Table of Contents')
+        margins = ws.page_margins
+        margins.left = margins.right = margins.bottom = 0.25
+        margins.top = 0.5
+
+        ws.column_dimensions['A'].width = ExcelOutput.google_width(250)
+        ws.column_dimensions['B'].width = ExcelOutput.google_width(124)
+        ws.column_dimensions['C'].width = ExcelOutput.google_width(35)
+        ws.column_dimensions['D'].width = ExcelOutput.google_width(138)
+
+        ws['C1'] = 'Table of Contents'
+        ws['C1'].style = 'heading'
+
+        ws['B3'] = 'Resources'
+        ws['B3'].style = 'subheading'
+        ws['B3'].alignment = Alignment()
+
+        ws['B4'] = 'Staff'
+        ws['B4'].hyperlink = Hyperlink(ref="A1", location=f"Staff!A1", target=None)
+        ws['B4'].font = Font(underline='single', color='000000')
+
+        ws['B5'] = 'Student Index'
+        ws['B5'].hyperlink = Hyperlink(ref="A1", location=f"Student Index!A1", target=None)
+        ws['B5'].font = Font(underline='single', color='000000')
+
+        ws['B6'] = 'PTA Board'
+        ws['B6'].hyperlink = Hyperlink(ref="A1", location=f"PTA Board!A1", target=None)
+        ws['B6'].font = Font(underline='single', color='000000')
+
+        ws['D3'] = 'Class Lists'
+        ws['D3'].style = 'subheading'
+        ws['D3'].alignment = Alignment()
+
+        index = 4
+        for c in self.data.class_lists:
+            ws[f'D{index}'].value = c.title()
+            ws[f'D{index}'].hyperlink = Hyperlink(ref="A1", location=f"{c.title()}!A1", target=None)
+            ws[f'D{index}'].font = Font(underline='single', color='000000')
+            index += 1
+
+
+    def create_staff(self):
+        ws = self.wb.create_sheet(title='Staff')
+        margins = ws.page_margins
+        margins.left = margins.right = margins.bottom = 0.25
+        margins.top = 0.5
+
+        ws.column_dimensions['A'].width = ExcelOutput.google_width(128)
+        ws.column_dimensions['B'].width = ExcelOutput.google_width(140)
+        ws.column_dimensions['C'].width = ExcelOutput.google_width(35)
+        ws.column_dimensions['D'].width = ExcelOutput.google_width(26)
+        ws.column_dimensions['E'].width = ExcelOutput.google_width(114)
+        ws.column_dimensions['F'].width = ExcelOutput.google_width(33)
+        ws.column_dimensions['G'].width = ExcelOutput.google_width(72)
+        ws.column_dimensions['H'].width = ExcelOutput.google_width(146)
+        ws.column_dimensions['I'].width = ExcelOutput.google_width(34)
+
+        ws.merge_cells('A1:I1')
+        ws['A1'] = 'HAMMERSCHMIDT STAFF'
+        ws['A1'].style = 'heading'
+        ws['A1'].alignment = Alignment(horizontal = 'center', vertical='bottom')
+
+        ws['A3'] = 'OFFICE'
+        ws['A3'].font = Font(name='Arial', bold=True, size=10)
+        ws['A3'].border = Border(bottom=self.thin_border)
+        ws['B3'] = 'EMAIL'
+        ws['B3'].font = Font(name='Arial', bold=True, size=10)
+        ws['B3'].border = Border(bottom=self.thin_border)
+        ws['C3'] = 'EXT.'
+        ws['C3'].font = Font(name='Arial', bold=True, size=10)
+        ws['C3'].border = Border(bottom=self.thin_border)
+
+        ws['E3'] = 'TEACHER'
+        ws['E3'].font = Font(name='Arial', bold=True, size=10)
+        ws['E3'].border = Border(bottom=self.thin_border)
+        ws['F3'].border = Border(bottom=self.thin_border)
+        ws['G3'] = 'GRADE'
+        ws['G3'].font = Font(name='Arial', bold=True, size=10)
+        ws['G3'].border = Border(bottom=self.thin_border)
+        ws['H3'] = 'EMAIL'
+        ws['H3'].font = Font(name='Arial', bold=True, size=10)
+        ws['H3'].border = Border(bottom=self.thin_border)
+        ws['I3'] = 'EXT.'
+        ws['I3'].font = Font(name='Arial', bold=True, size=10)
+        ws['I3'].border = Border(bottom=self.thin_border)
+
+
+    def print_class(self, cls):
+        if self.workers:
+            self.submit_class(cls)
+            return
+
+        ws = self.wb.create_sheet(title=cls.title())
+        # The same margins PageFitter fits the class list to
+        margins = ws.page_margins
+        margins.left = margins.right = margins.top = margins.bottom = 0.25
+
+        fit = self.fitter.fit(cls)
+        if not fit.fits:
+            print(f"WARNING: The class list for {cls.teacher} is predicted to overflow one page: {fit}")
+
+        ws.merge_cells('A1:E1')
+        ws.merge_cells('A2:E2')
+        for column, width in fit.widths.items():
+            ws.column_dimensions[column].width = ExcelOutput.google_width(width)
+
+        ws['A1'] = cls.teacher.title
+        ws['A1'].style = 'heading'
+        ws['A2'] = f"{cls.grade.pretty()} - {cls.room}"
+        ws['A2'].style = 'subheading'
+
+        ws.append([])
+        ws.append(['Student', 'Family Address', 'Parent/Guardian', 'Email', 'Phone'])
+        ws['A4'].style = 'tableheadingbegin'
+        ws['B4'].style = 'tableheading'
+        ws['C4'].style = 'tableheading'
+        ws['D4'].style = 'tableheading'
+        ws['E4'].style = 'tableheadingend'
+
+        idx = 5
+
+        for s in cls.students:
+            address = s.address() or ''
+            guardians = s.guardians if s.guardians else []
+            ws.insert_rows(idx=idx)
+            ws.cell(row=idx, column=1)
+            ws[f'A{idx}'] = s.title
+            ws[f'A{idx}'].style = 'student'
+            ws[f'E{idx}'].style = 'studentend'
+            num_guardians = len(guardians)
+
+            if num_guardians > 0:
+                ws[f'C{idx}'] = guardians[0].title()
+                if guardians[0].email:
+                    ws[f'D{idx}'].value = f'=hyperlink("{guardians[0].email_link()}", "{guardians[0].email}")'
+                ws[f'D{idx}'].font = self.hyperlink_font
+                ws[f'D{idx}'].alignment = Alignment(wrap_text=True, vertical='center')
+
+                if guardians[0].phone:
+                    ws[f'E{idx}'].value = f'=hyperlink("{guardians[0].phone_link()}", "{guardians[0].phone}")'
+                ws[f'E{idx}'].font = self.hyperlink_font
+                ws[f'E{idx}'].alignment = Alignment(wrap_text=True, vertical='center')
+
+                if num_guardians > 1 or address:
+                    idx += 1
+                    ws.insert_rows(idx=idx)
+                    ws[f'A{idx}'].style = 'student'
+                    ws[f'E{idx}'].style = 'studentend'
+                    if address:
+                        ws[f'B{idx}'] = address
+                    if num_guardians > 1:
+                        ws[f'C{idx}'] = guardians[1].title()
+                        ws[f'D{idx}'].hyperlink = guardians[1].email_link()
+                        ws[f'D{idx}'].value = guardians[1].email
+                        ws[f'D{idx}'].alignment = Alignment(wrap_text=True, vertical='center')
+                        ws[f'E{idx}'].hyperlink = guardians[1].phone_link()
+                        ws[f'E{idx}'].value = guardians[1].phone
+                        ws[f'E{idx}'].alignment = Alignment(wrap_text=True, vertical='center')
+            # Put border on bottom
+            ws[f'A{idx}'].border = Border(left=self.thin_border, bottom=self.thin_border)
+            ws[f'B{idx}'].border = Border(bottom=self.thin_border)
+            ws[f'C{idx}'].border = Border(bottom=self.thin_border)
+            ws[f'D{idx}'].border = Border(bottom=self.thin_border)
+            ws[f'E{idx}'].border = Border(bottom=self.thin_border, right=self.thin_border)
+
+            idx += 1
+
+        if fit.scale() != 1:
+            self.shrink(ws, fit)
+
+    def shrink(self, ws, fit):
+        for row_num, height in enumerate(fit.row_heights, start=1):
+            ws.row_dimensions[row_num].height = height
+            for cell in ws[row_num]:
+                if cell.value is not None:
+                    font = copy(cell.font)
+                    font.size = round((font.size or DEFAULT_FONT.size) * fit.scale(), 1)
+                    cell.font = font
+
+    def submit_class(self, cls):
+        from concurrent.futures import ProcessPoolExecutor
+        from phonebook.parallel import init_worker, render_class
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker, initargs=(self.data,))
+
+        # An empty sheet holds the place of the class so the sheet order matches
+        self.wb.create_sheet(title=cls.title())
+        self.parts[cls.title()] = self.pool.submit(render_class, self.data.class_lists.index(cls))
+
+    def collect_classes(self):
+        # Merge the styles in sheet order so they are numbered the same as a serial render
+        for title, future in self.parts.items():
+            self.parts[title] = future.result()
+            self.parts[title].merge_styles(self.wb)
+        self.pool.shutdown()
+        self.pool = None
+
+    def finish(self, data):
+        if self.pool:
+            self.collect_classes()
+        self.wb.remove(self.wb.active)
+        self.create_index(data)
+        self.create_thank_you_page()
+        self.create_pta_board_page()
+        self.save()
+
+    def finish_class_book(self, data, cls):
+        """
+        Finishes a workbook of just the class and the index of its students
+        """
+        self.wb.remove(self.wb.active)
+        ws = self.wb[cls.title()]
+        ws.oddHeader.center.text = f"WHS PTA Phone Book {YEAR}"
+        ws.oddHeader.center.size = 8
+        self.create_index(data, [cls])
+        self.save()
+
+    def serialize(self):
+        """
+        Writes the workbook parts into an archive in memory
+        """
+        from phonebook.archive import Archive, build_time
+        from phonebook.parallel import PartsExcelWriter
+
+        # Same as openpyxl's save_workbook apart from writing the rendered class
+        # sheets and recording the build time instead of the current time
+        self.wb.properties.created = self.wb.properties.modified = build_time()
+        archive = Archive()
+        PartsExcelWriter(self.wb, archive, self.parts).write_data()
+        return archive
+
+    def save(self):
+        from phonebook.archive import build_time
+
+        return self.serialize().save(self.output, compression=self.compression, date_time=build_time().timetuple())
+
+    def create_thank_you_page(self):
+        ws = self.wb.create_sheet(title='Thank You')
+        margins = ws.page_margins
+        margins.left = margins.right = 0.7
+        margins.top = margins.bottom = 0.75
+
+        ws.column_dimensions['A'].width = ExcelOutput.google_width(245)
+        ws.column_dimensions['B'].width = ExcelOutput.google_width(194)
+        ws.column_dimensions['C'].width = ExcelOutput.google_width(90)
+
+        ws['B2'] = 'Many thanks to Mr. Hoganson and Graphics Arts Services, Inc.'
+        ws['B2'].style = 'subheading'
+        ws['B3'] = 'for helping format this PTA phone book!'
+        ws['B3'].style = 'subheading'
+
+        ws['B5'] = 'Thank you so much to Mrs. Hoganson for coordinating'
+        ws['B5'].style = 'subheading'
+        ws['B6'] = 'the student-created artwork for the covers.'
+        ws['B6'].style = 'subheading'
+
+        ws['B8'] = 'Great job to the many students who submitted artwork for the covers!'
+        ws['B8'].style = 'subheading'
+        ws['A10'] = 'Front cover'
+        ws['A10'].alignment = Alignment(horizontal='right')
+        ws['A11'] = 'Inside front cover'
+        ws['A11'].alignment = Alignment(horizontal='right')
+        ws['A12'] = 'Inside back cover'
+        ws['A12'].alignment = Alignment(horizontal='right')
+        ws['A13'] = 'Back cover'
+        ws['A13'].alignment = Alignment(horizontal='right')
+
+        ws['B10'] = artists['front'][0]
+        ws['B10'].style = 'subheading'
+        ws['B10'].alignment = Alignment(horizontal = 'center', vertical='bottom')
+        ws['C10'] = artists['front'][1]
+
+        ws['B11'] = artists['front inside'][0]
+        ws['B11'].style = 'subheading'
+        ws['B11'].alignment = Alignment(horizontal = 'center', vertical='bottom')
+        ws['C11'] = artists['front inside'][1]
+
+        ws['B12'] = artists['back inside'][0]
+        ws['B12'].style = 'subheading'
+        ws['B12'].alignment = Alignment(horizontal = 'center', vertical='bottom')
+        ws['C12'] = artists['back inside'][1]
+
+        ws['B13'] = artists['back'][0]
+        ws['B13'].style = 'subheading'
+        ws['B13'].alignment = Alignment(horizontal = 'center', vertical='bottom')
+        ws['C13'] = artists['back'][1]
+
+        img = Image(IMAGES_DIR / 'making-a-difference.png')
+        img.anchor = 'B15'
+        ws['B15'].alignment = Alignment(horizontal='center')
+        ws.add_image(img)
+
+        ws['B25'] = 'Want to get involved in the PTA?'
+        ws['B25'].font = Font(name='Arial', bold=True, size=14)
+        ws['B25'].alignment = Alignment(horizontal='center')
+        ws['B27'] = 'There are opportunities year round to help make'
+        ws['B27'].font = Font(name='Arial', bold=True, size=14)
+        ws['B27'].alignment = Alignment(horizontal='center')
+        ws['B28'] = 'Hammerschmidt even more amazing for our kids.'
+        ws['B28'].font = Font(name='Arial', bold=True, size=14)
+        ws['B28'].alignment = Alignment(horizontal='center')
+        ws['B29'] = 'We have options for every parent and every schedule!'
+        ws['B29'].font = Font(name='Arial', bold=True, size=14)
+        ws['B29'].alignment = Alignment(horizontal='center')
+
+        ws['B31'] = 'Please join us at a monthly PTA meeting'
+        ws['B31'].font = Font(name='Arial', bold=True, size=14)
+        ws['B31'].alignment = Alignment(horizontal='center')
+        ws['B32'] = 'or contact president.whspta@gmail.com'
+        ws['B32'].font = Font(name='Arial', bold=True, size=14)
+        ws['B32'].alignment = Alignment(horizontal='center')
+        ws['B33'] = 'for more information about how you can get involved. '
+        ws['B33'].font = Font(name='Arial', bold=True, size=14)
+        ws['B33'].alignment = Alignment(horizontal='center')
+
+    def create_pta_board_page(self):
+        ws = self.wb.create_sheet(title='PTA Board')
+        margins = ws.page_margins
+        margins.left = margins.right = 0.25
+        margins.top = margins.bottom = 0.25
+
+        ws.column_dimensions['A'].width = 30.7
+        ws.column_dimensions['B'].width = 27.8
+        ws.column_dimensions['C'].width = 272
+        ws.merge_cells('A1:C1')
+
+        ws['B2'] = f'William Hammerschmidt School PTA Board {YEAR}'
+        ws['B2'].alignment = Alignment(horizontal='center')
+        ws['B2'].font = Font(size=11, bold=True)
+
+    def create_index(self, data, class_lists=None):
+        ws = self.wb.create_sheet(title='Student Index')
+        margins = ws.page_margins
+        margins.left = margins.right = 0.15
+        margins.top = 0.35
+        margins.bottom = 0.25
+
+        ws.merge_cells('A1:G1')
+        ws.merge_cells('A2:G2')
+        ws['A1'] = 'STUDENT INDEX'
+        ws['A1'].style = 'heading'
+        ws['A1'].alignment = Alignment(horizontal = 'center', vertical='bottom')
+        ws['A1'].font = Font(name='Arial', bold=True, size=11)
+        ws['A1'].border = Border(bottom=self.medium_border)
+        ws['A2'] = 'Last Name, First Name, Grade, Teacher'
+        ws['A2'].style = 'subheading'
+        ws['A2'].font = Font(name='Arial', bold=True, size=10)
+
+        name_width = 25
+        grade_width = 3.85
+        teacher_width = 14.42
+
+        ws.column_dimensions['A'].width = name_width
+        ws.column_dimensions['B'].width = grade_width
+        ws.column_dimensions['C'].width = teacher_width
+        ws.column_dimensions['D'].width = 4.7
+        ws.column_dimensions['E'].width = name_width
+        ws.column_dimensions['F'].width = grade_width
+        ws.column_dimensions['G'].width = teacher_width
+
+        pos = ExcelIndexPositioner(columns=[('A', 'B', 'C'), ('E', 'F', 'G')])
+
+        for letter, students in data.student_index(class_lists=class_lists):
+            pos.next_letter()
+
+            # print(f"{pos.letter_merge()} : {pos.letter()}: {letter}")
+            ws.merge_cells(pos.letter_merge())
+            ws[pos.letter()] = letter
+            ws[pos.letter()].style = 'indexletter'
+
+            for s in students:
+                pos.next_student()
+                ws[pos.pos(0)] = s.index_name
+                ws[pos.pos(0)].style = 'indexstudent'
+                ws[pos.pos(1)] = s.grade
+                ws[pos.pos(1)].style = 'indexstudent'
+                ws[pos.pos(2)] = s.teacher
+                ws[pos.pos(2)].style = 'indexstudent'
+                # print(f"{pos.pos()}: {s.index_name:30} {s.grade} {s.teacher}")
+            # print("")
+
+        for row_num in range(1, ws.max_row + 1):
+            ws.row_dimensions[row_num].height = 12
+
+
+
+class ExcelIndexPositioner:
+    """
+    Produces a position for writing students into the index
+    using a two column structure
+    """
+
+    def __init__(self, page_height=62, page_buffer=4, columns=['A', 'E'], letter_start_index=1, student_start_index=1):
+        self.letter_start_index = letter_start_index
+        self.student_start_index = student_start_index
+        self.index = 2
+        self.page_height = page_height
+        self.page_buffer = page_buffer
+        self.columns = columns
+        self.column_index = 0
+        self.page = 0
+        self.page_start_letter = True # First page always starts with a letter
+
+    def letter_merge(self):
+        return f"{self.columns[self.column_index][0]}{self.index-1}:{self.columns[self.column_index][-1]}{self.index}"
+
+    def letter(self):
+        return f"{self.columns[self.column_index][0]}{self.index-1}"
+
+    def pos(self, col=0):
+        return f"{self.columns[self.column_index][col]}{self.index}"
+
+    def next_letter(self):
+        self.allocate_space(size=3, buffer=4, start_index=self.letter_start_index, is_letter=True)
+
+    def is_last_column(self):
+        return self.column_index == len(self.columns) - 1
+
+    def has_enough_space_in_column(self, buffer):
+        limit = (self.page+1) * self.page_height - buffer
+        # print(f"  {self.index} < {limit}? {self.index < limit}")
+        return self.index < limit
+
+    def next_student(self):
+        self.allocate_space(size=1, buffer=1, start_index=self.student_start_index)
+
+    def allocate_space(self, size, buffer, start_index, is_letter=False):
+        if self.has_enough_space_in_column(buffer=buffer):
+            # Enough space, use same column
+            self.index += size
+        elif self.is_last_column():
+            # Move down a page
+            self.page += 1
+            page_start = self.page * self.page_height + 1
+            # print(f"Moving down a page to start index of {start_index} added to {page_start}")
+            self.column_index = 0
+            self.index = page_start + start_index
+            self.page_start_letter = is_letter
+        else:
+            # Move over a column
+            self.column_index = (self.column_index + 1) % len(self.columns)
+            column_start = self.page * self.page_height + 1
+            self.index = column_start + start_index
+            if self.page == 0:
+                self.index += 3
+            if self.page_start_letter:
+                self.index += 1
+            # print(f"  shifting a column and moving to start at index {self.index}")
@@ -0,0 +1,239 @@
+"""
+Re-encodes the cover artwork and the images embedded in the workbook as small
+as they can be while still looking the same, and checks that they fit in the
+size budget for the book.
+
+JPEGs are binary searched for the lowest quality and PNGs for the smallest
+palette that keep the peak signal to noise ratio against the original above
+a floor. Needs Pillow.
+
+    python3 -m phonebook.images --budget 20M --output-dir covers covers/modified/*.jpg
+    python3 -m phonebook.images --output-dir images originals/*.png
+"""
+import argparse
+import io
+import math
+import os
+import re
+import sys
+
+from collections import namedtuple
+
+
+# Above about 38 dB the differences are not visible on printed artwork
+PSNR_FLOOR = 38.0
+MIN_QUALITY = 30
+MAX_QUALITY = 95
+PALETTE_SIZES = [256, 128, 64, 32, 16, 8, 4, 2]
+# The formats that can be written back without changing what kind of file it is
+FORMATS = ['JPEG', 'PNG']
+
+Encoding = namedtuple('Encoding', ['data', 'description', 'psnr'])
+Result = namedtuple('Result', ['path', 'output', 'description', 'psnr', 'original_size', 'size', 'warning'])
+
+
+def parse_size(size):
+    """
+    Returns the number of bytes in a size like 20M, 500K or 1048576
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([KMG]?)i?B?", size.strip(), re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid size: {size}")
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** ' KMG'.index(unit.upper() or ' '))
+
+
+def parse_dimensions(dimensions):
+    match = re.fullmatch(r"(\d+)x(\d+)", dimensions)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid dimensions: {dimensions}")
+    return int(match.group(1)), int(match.group(2))
+
+
+def format_size(size):
+    return f"{size / 1024:,.0f} KiB"
+
+
+def image_format(path):
+    """
+    Returns the format Pillow reads the image as, or None when it is not an image
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(path) as image:
+            return image.format
+    except UnidentifiedImageError:
+        return None
+
+
+def psnr(reference, image):
+    from PIL import ImageChops, ImageStat
+
+    stat = ImageStat.Stat(ImageChops.difference(reference, image))
+    mse = sum(stat.sum2) / (len(stat.sum2) * reference.width * reference.height)
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def decode(data, mode):
+    from PIL import Image
+
+    return Image.open(io.BytesIO(data)).convert(mode)
+
+
+def encode(image, fmt, **params):
+    f = io.BytesIO()
+    image.save(f, fmt, optimize=True, **params)
+    return f.getvalue()
+
+
+def optimize_jpeg(image, floor, dpi):
+    """
+    Returns the lowest quality encoding that meets the floor, or None when even
+    the highest quality does not
+    """
+    best = None
+    low, high = MIN_QUALITY, MAX_QUALITY
+    while low <= high:
+        quality = (low + high) // 2
+        data = encode(image, 'JPEG', quality=quality, dpi=dpi)
+        score = psnr(image, decode(data, image.mode))
+        if score >= floor:
+            best = Encoding(data, f"JPEG quality {quality}", score)
+            high = quality - 1
+        else:
+            low = quality + 1
+    return best
+
+
+def optimize_png(image, floor, dpi):
+    from PIL import Image
+
+    data = encode(image, 'PNG', dpi=dpi)
+    best = Encoding(data, 'PNG', math.inf)
+
+    # Fewer colors never looks better so search for the smallest palette that passes
+    method = Image.Quantize.FASTOCTREE if image.mode == 'RGBA' else Image.Quantize.MEDIANCUT
+    low, high = 0, len(PALETTE_SIZES) - 1
+    while low <= high:
+        middle = (low + high) // 2
+        colors = PALETTE_SIZES[middle]
+        data = encode(image.quantize(colors, method=method), 'PNG', dpi=dpi)
+        score = psnr(image, decode(data, image.mode))
+        if score >= floor:
+            if len(data) < len(best.data):
+                best = Encoding(data, f"PNG {colors} colors", score)
+            low = middle + 1
+        else:
+            high = middle - 1
+    return best
+
+
+def optimize(path, output, floor=PSNR_FLOOR, max_size=None):
+    """
+    Writes the smallest encoding of the image that meets the floor to output
+    """
+    from PIL import Image, ImageOps
+
+    with open(path, 'rb') as f:
+        original = f.read()
+
+    image = Image.open(io.BytesIO(original))
+    fmt = image.format
+    if fmt not in FORMATS:
+        raise ValueError(f"{path} is not a JPEG or PNG image")
+    dpi = image.info.get('dpi', (72, 72))
+    mode = 'RGBA' if fmt == 'PNG' and ('transparency' in image.info or 'A' in image.mode) else 'RGB'
+    if image.mode == 'L':
+        mode = 'L'
+    image = image.convert(mode)
+
+    # Only ever shrink since img2pdf and the sheet scale the images up as needed
+    resized = max_size is not None and (image.width > max_size[0] or image.height > max_size[1])
+    if resized:
+        image = ImageOps.contain(image, max_size, Image.Resampling.LANCZOS)
+
+    warning = None
+    best = optimize_png(image, floor, dpi) if fmt == 'PNG' else optimize_jpeg(image, floor, dpi)
+    if best is None and resized:
+        # The original is too large to use so the best that can be done is the highest quality
+        data = encode(image, 'JPEG', quality=MAX_QUALITY, dpi=dpi)
+        best = Encoding(data, f"JPEG quality {MAX_QUALITY}", psnr(image, decode(data, image.mode)))
+        warning = f"{output} is below the {floor} dB floor at quality {MAX_QUALITY} after resizing"
+    elif best is None or (not resized and len(original) <= len(best.data)):
+        best = Encoding(original, 'unchanged', math.inf)
+
+    with open(output, 'wb') as f:
+        f.write(best.data)
+
+    return Result(path, output, best.description, best.psnr, len(original), len(best.data), warning)
+
+
+def optimize_all(paths, output_dir, floor=PSNR_FLOOR, max_size=None, workers=None):
+    """
+    Optimizes the images in worker processes and writes them to output_dir
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    outputs = [os.path.join(output_dir, os.path.basename(p)) for p in paths]
+    os.makedirs(output_dir, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(optimize, paths, outputs, [floor] * len(paths), [max_size] * len(paths)))
+
+
+def report(results, budget=None, data_pdf=None, floor=PSNR_FLOOR):
+    """
+    Prints the size of each image and the book and returns whether it fits the budget
+    """
+    width = max(len(r.output) for r in results)
+    for r in results:
+        quality = 'lossless' if math.isinf(r.psnr) else f"{r.psnr:.1f} dB"
+        print(f"{r.output:{width}} {r.description:18} {quality:>9} {format_size(r.size):>12} (was {format_size(r.original_size)})")
+    for r in results:
+        if r.warning:
+            print(f"WARNING: {r.warning}")
+
+    total = sum(r.size for r in results)
+    if data_pdf:
+        data_size = os.path.getsize(data_pdf)
+        print(f"{data_pdf:{width}} {'':18} {'':>9} {format_size(data_size):>12}")
+        total += data_size
+
+    if budget is None:
+        print(f"Total {format_size(total)}")
+        return True
+
+    print(f"Total {format_size(total)} of the {format_size(budget)} budget")
+    if total > budget:
+        print(f"WARNING: The book is {format_size(total - budget)} over budget without going below {floor} dB")
+        return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python3 -m phonebook.images', usage='%(prog)s [options] image [image ...]')
+    parser.add_argument('images', nargs='+', help='the JPEG and PNG images to optimize')
+    parser.add_argument('--output-dir', required=True, help='where to write the images')
+    parser.add_argument('--budget', type=parse_size, help='the largest the book may be, like 20M')
+    parser.add_argument('--data-pdf', help='the PDF of the class lists to count against the budget')
+    parser.add_argument('--floor', type=float, default=PSNR_FLOOR, help='the lowest PSNR in dB an image may have')
+    parser.add_argument('--max-size', type=parse_dimensions, help='shrink larger images to fit, like 2480x3508')
+    parser.add_argument('--jobs', type=int, help='optimize the images in this many worker processes')
+
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    for path in args.images:
+        if image_format(path) not in FORMATS:
+            parser.error(f"{path} is not a JPEG or PNG image")
+    # Optimizing an optimized image loses a little more each time so keep the originals
+    if any(os.path.samefile(os.path.dirname(os.path.abspath(i)), args.output_dir) for i in args.images if os.path.isdir(args.output_dir)):
+        parser.error('--output-dir must not be the directory of the original images')
+
+    results = optimize_all(args.images, args.output_dir, args.floor, args.max_size, args.jobs)
+    return 0 if report(results, args.budget, args.data_pdf, args.floor) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
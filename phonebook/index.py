@@ -0,0 +1,83 @@
+"""
+Sorts the students for the student index in runs that are written to
+temporary files and merged, so the memory the sort uses stays the same
+however many schools and years go into the book.
+"""
+import heapq
+import pickle
+
+from collections import namedtuple
+from itertools import count, groupby, islice
+
+
+# The number of students sorted in memory at a time
+RUN_SIZE = 10000
+# The number of students pickled together in a run file
+CHUNK_SIZE = 256
+
+# Only what the index prints. The order breaks ties between students with
+# the same name so they are listed in class order like a stable sort would.
+IndexEntry = namedtuple('IndexEntry', ['name', 'order', 'index_name', 'grade', 'teacher'])
+
+
+def index_entries(class_lists):
+    order = count()
+    for c in class_lists:
+        for s in c.students:
+            yield IndexEntry(s.name, next(order), s.index_name, str(s.grade), s.teacher.class_list_lookup.title())
+
+
+def write_run(f, run):
+    for i in range(0, len(run), CHUNK_SIZE):
+        pickle.dump(run[i:i + CHUNK_SIZE], f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+
+
+def read_run(f):
+    while True:
+        try:
+            yield from pickle.load(f)
+        except EOFError:
+            return
+
+
+def external_sort(records, run_size=RUN_SIZE):
+    """
+    Returns the records in order. Each run of run_size records is sorted in
+    memory and written to a temporary file, then the runs are merged.
+    """
+    # Checked here rather than in the generator so a bad size fails when it is passed
+    if run_size < 1:
+        raise ValueError(f"run_size must be at least 1, not {run_size}")
+    return merge_runs(iter(records), run_size)
+
+
+def merge_runs(records, run_size):
+    import tempfile
+
+    runs = []
+    try:
+        while run := sorted(islice(records, run_size)):
+            if not runs and len(run) < run_size:
+                # Everything fit in one run so there is nothing to merge
+                yield from run
+                return
+
+            f = tempfile.TemporaryFile()
+            runs.append(f)
+            write_run(f, run)
+            del run
+
+        yield from heapq.merge(*(read_run(f) for f in runs))
+    finally:
+        for f in runs:
+            f.close()
+
+
+def student_index(class_lists, run_size=RUN_SIZE):
+    """
+    Returns each letter of the index with the students under it in order.
+    The students of a letter must be read before moving on to the next.
+    """
+    entries = external_sort(index_entries(class_lists), run_size)
+    return groupby(entries, key=lambda e: e.name[0])
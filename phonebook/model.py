@@ -0,0 +1,317 @@
+import re
+
+from phonebook.contacts import EXTENSION, NON_DIGITS
+from phonebook.index import RUN_SIZE, student_index
+
+
+def fix_name(s):
+    # Mcdonald -> McDonald
+    name = re.sub(r"Mc([a-z])", lambda m: "Mc" + m.group(1).upper(), s)
+
+    # (Rj) -> (RJ).  Hopefully they do not put nicknames that aren't capitalized in parens
+    name = re.sub(r"(\(.*?\))", lambda m: m.group(1).upper(), name)
+
+    return name
+
+class Student:
+    def __init__(self, name, grade, teacher, guardians=None):
+        # Strip any suffixes like I, II, III, etc since that was included in the class list but not the parent file
+        self.name = re.sub(r", I+$", "", name.strip())
+        self.title = fix_name(re.sub(r"(.+),\s+(.+)", r"\2 \1", self.name).title())
+        self.index_name = fix_name(self.name.title())
+        self.grade = grade
+        self.teacher = teacher
+        self.guardians = guardians
+        self.household = None
+        self._address = None
+        self._address_cached = False
+
+    def __repr__(self):
+        return str(self)
+
+    def __hash__(self):
+        return hash((self.grade, self.name))
+
+    def __eq__(self, other):
+        a = (self.grade, self.name)
+        b = (other.grade, other.name)
+        return a == b
+
+    def __lt__(self, other):
+        return (self.grade, self.name) < (other.grade, other.name)
+
+    def __str__(self):
+        return f"{self.name} {self.title} - Grade {self.grade} - Teacher {self.teacher.title} - Guardians {self.guardians}"
+
+    def address(self):
+        # Only the student's own guardians since a household can join step-families
+        if not self._address_cached:
+            self._address = next((g.address for g in self.guardians or [] if g.address), None)
+            self._address_cached = True
+        return self._address
+
+    def invalidate(self):
+        self._address_cached = False
+
+    @staticmethod
+    def parse_from_parent_file(fields, households):
+        grade = Grade(fields['grade'])
+
+        guardians = [households.guardian(
+                name=fields['guardian'],
+                email=fields['email'],
+                phone=fields['phone'],
+                address=fields['address'])]
+
+        if fields['guardian_2']:
+            guardians.append(households.guardian(
+                name=fields['guardian_2'],
+                email=fields['email_2'],
+                phone=fields['phone_2'],
+                ))
+
+        teacher = Teacher(name=fields['teacher'], grade=grade)
+
+        student = Student(
+                name=fields['name'],
+                grade=grade,
+                teacher=teacher,
+                guardians=guardians)
+        households.add_student(student)
+
+        return student
+
+class Grade:
+    def __init__(self, value):
+        stripped = re.sub(r"(ST|ND|RD|TH|DG)", "", str(value)).strip()
+        if stripped == 'K':
+            self.grade = 'K'
+            self.order = 0
+        else:
+            self.grade = int(float(stripped))
+            self.order = self.grade
+
+    def pretty(self):
+        match self.order:
+            case 0: return "Kindergarten"
+            case 1: return "1st Grade"
+            case 2: return "2nd Grade"
+            case 3: return "3rd Grade"
+            case 4: return "4th Grade"
+            case 5: return "5th Grade"
+            case _: raise ValueError("Invalid grade")
+
+    def __lt__(self, other):
+        return self.order < other.order
+
+    def __hash__(self):
+        return hash(self.order)
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return str(self.grade)
+
+    def __eq__(self, other):
+        return self.order == other.order
+
+class Teacher:
+    def __init__(self, name, grade):
+        self.name = name
+        if self.name == 'MORGAN EVANCIC':
+            self.name = 'MORGAN BAETZ'
+        self.grade = grade
+        self.title = self.name.title()
+        self.class_list_lookup = self.name.split(" ")[-1]
+        self.students = []
+
+    def __lt__(self, other):
+        return (self.grade, self.name) < (other.grade, other.name)
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return f"{self.grade} - {self.title}"
+
+    def __eq__(self, other):
+        a = (self.grade, self.class_list_lookup)
+        b = (other.grade, other.class_list_lookup)
+        return a == b
+
+    def add_students(self, students):
+        self.students.extend(students)
+
+class Class:
+    def __init__(self, room, teacher, grade, students):
+        self.room = re.sub(r"# ", "", room.title())
+        self.teacher = teacher
+        self.grade = grade
+        self.students = students
+
+    def title(self):
+        return f"{self.grade.grade} {self.teacher.class_list_lookup}"
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return f"{self.grade} - {self.teacher} - {self.students}"
+
+class Guardian:
+    def __init__(self, name, email, phone=None, address=None):
+        # The contact fields are cleaned up for every guardian at once by ParentParser.parse_students
+        self.name = name
+        self.email = email
+        self.phone = phone
+        self.address = address
+        self.household = None
+
+    @staticmethod
+    def key(name, email):
+        """
+        Returns the key siblings' records for the same guardian share, or None
+        when there is no email to tell guardians with the same name apart
+        """
+        if not email or not str(email).strip():
+            return None
+        # Parents often share a family email so the name is part of the key.
+        # The words are sorted since names are typed LAST, FIRST as well as FIRST LAST.
+        return str(email).strip().lower(), ' '.join(sorted(re.findall(r"[a-z]+", (name or '').lower())))
+
+    def merge(self, phone=None, address=None):
+        # Each parent file only has some of the fields so fill in whatever is missing
+        if phone and not self.phone:
+            self.phone = phone
+        if address and not self.address:
+            self.address = address
+
+    def title(self):
+        return fix_name(self.name.title())
+
+    def phone_link(self):
+        return f"https://call.ctrlq.org/1{NON_DIGITS.sub('', EXTENSION.sub('', str(self.phone)))}" if self.phone else ''
+
+    def email_link(self):
+        return f"mailto:{self.email}" if self.email else ''
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return f"{self.title()} {self.email} {self.phone} {self.address}"
+
+class Household:
+    """
+    A family of students sharing one or more guardians
+    """
+
+    def __init__(self):
+        self.guardians = []
+        self.students = []
+
+    def invalidate(self):
+        # A guardian's address changed so the students look theirs up again
+        for s in self.students:
+            s.invalidate()
+
+    def add_guardian(self, guardian):
+        guardian.household = self
+        self.guardians.append(guardian)
+        self.invalidate()
+
+    def add_student(self, student):
+        student.household = self
+        self.students.append(student)
+
+    def absorb(self, other):
+        for g in other.guardians:
+            self.add_guardian(g)
+        for s in other.students:
+            self.add_student(s)
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return f"{[s.title for s in self.students]} - Guardians {self.guardians}"
+
+class Households:
+    """
+    Interns guardians by email and name so siblings share the same guardian
+    records and groups students who share a guardian into a household
+    """
+
+    def __init__(self):
+        self.guardians = []
+        self.interned = {}
+
+    def guardian(self, name, email, phone=None, address=None):
+        key = Guardian.key(name, email)
+        guardian = self.interned.get(key) if key else None
+        if guardian is None:
+            guardian = Guardian(name=name, email=email, phone=phone, address=address)
+            self.guardians.append(guardian)
+            if key:
+                self.interned[key] = guardian
+        else:
+            guardian.merge(phone=phone, address=address)
+            if guardian.household:
+                guardian.household.invalidate()
+        return guardian
+
+    def add_student(self, student):
+        households = []
+        for g in student.guardians:
+            if g.household and g.household not in households:
+                households.append(g.household)
+
+        household = households[0] if households else Household()
+        # The student links households that were previously thought to be separate
+        for other in households[1:]:
+            household.absorb(other)
+        for g in student.guardians:
+            if g.household is not household:
+                household.add_guardian(g)
+        household.add_student(student)
+
+class AllData:
+    def __init__(self, class_lists, students, households=None):
+        self.class_lists = class_lists
+        self.students = students
+        self.households = households
+
+        self.__update_class_list_data()
+
+    def __update_class_list_data(self):
+        # Replace students in the class list with those from the parent information
+        # since it contains more information
+        for c in self.class_lists:
+            parent_students = {s: s for s in self.students if s.teacher == c.teacher}
+            class_students = []
+            for s in c.students:
+                if s in parent_students:
+                    class_students.append(parent_students[s])
+                    del parent_students[s]
+                else:
+                    class_students.append(s)
+            class_students.sort()
+
+            if parent_students:
+                print(f"WARNING: Found the following students in the parent data not listed in the class data for teacher {c.teacher}")
+                print("\n".join(str(s) for s in parent_students.keys()))
+
+            c.students = class_students
+
+            # Replace the teacher with the data from the parent information since it has their full name
+            c.teacher = class_students[0].teacher
+
+    def student_index(self, run_size=RUN_SIZE, class_lists=None):
+        """
+        Returns each letter of the index with the students under it sorted by
+        name, for all of the classes unless class_lists is given
+        """
+        if class_lists is None:
+            class_lists = self.class_lists
+        return student_index(class_lists, run_size)
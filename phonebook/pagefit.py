@@ -0,0 +1,168 @@
+"""
+Predicts whether a class sheet fits on one printed page and picks the column
+widths and font size that make it fit.
+
+Text is measured with the Arial glyph widths below (in 1/1000 em, the same
+metrics as Helvetica) for the printable ASCII characters starting at space.
+Anything else is measured as a question mark.
+"""
+import math
+
+
+ARIAL_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+    )
+ARIAL_BOLD_WIDTHS = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+    )
+
+# Indexed by the ASCII code so a string is measured with one pass over its bytes
+ARIAL = (ARIAL_WIDTHS[ord('?') - 32],) * 32 + ARIAL_WIDTHS + (ARIAL_WIDTHS[ord('?') - 32],)
+ARIAL_BOLD = (ARIAL_BOLD_WIDTHS[ord('?') - 32],) * 32 + ARIAL_BOLD_WIDTHS + (ARIAL_BOLD_WIDTHS[ord('?') - 32],)
+
+# Letter paper printed with 0.25" margins on all sides, in points
+PAGE_WIDTH = 8.5 * 72
+PAGE_HEIGHT = 11 * 72
+MARGIN = 0.25 * 72
+
+# The default row height openpyxl declares in the workbook, used unless the text needs more
+DEFAULT_ROW_HEIGHT = 15
+LINE_HEIGHT = 1.25
+CELL_PADDING = 6
+
+COLUMNS = ['A', 'B', 'C', 'D', 'E']
+# The column widths in pixels used when everything fits
+DEFAULT_WIDTHS = {'A': 87, 'B': 128, 'C': 150, 'D': 250, 'E': 100}
+MIN_EMAIL_WIDTH = 120
+
+FONT_SIZE = 10
+FONT_SIZES = [10, 9.5, 9, 8.5, 8, 7.5, 7]
+STUDENT_SIZE = 11
+TITLE_SIZES = [12, 11]
+HEADING_SIZE = 9
+HEADINGS = ['Student', 'Family Address', 'Parent/Guardian', 'Email', 'Phone']
+
+
+def text_width(text, bold=False):
+    """
+    Returns the width of the text in 1/1000 em
+    """
+    widths = ARIAL_BOLD if bold else ARIAL
+    return sum(map(widths.__getitem__, str(text).encode('ascii', 'replace')))
+
+
+def to_pixels(width, size):
+    return width * size * 96 / 72000
+
+
+HEADING_WIDTHS = [text_width(h, bold=True) for h in HEADINGS]
+
+
+class PageFit:
+    def __init__(self, widths, font_size, row_heights, height, fits):
+        self.widths = widths
+        self.font_size = font_size
+        self.row_heights = row_heights
+        self.height = height
+        self.fits = fits
+
+    def scale(self):
+        return self.font_size / FONT_SIZE
+
+    def __repr__(self):
+        return f"PageFit(widths={self.widths}, font_size={self.font_size}, height={self.height:.1f}, fits={self.fits})"
+
+
+class PageFitter:
+    """
+    Measures the text of a class sheet once and then searches for the largest
+    font size at which the sheet fits on a page
+    """
+
+    def __init__(self, page_width=PAGE_WIDTH, page_height=PAGE_HEIGHT, margin=MARGIN):
+        self.available_width = (page_width - 2 * margin) * 96 / 72
+        self.available_height = page_height - 2 * margin
+
+    @staticmethod
+    def measure(cls):
+        """
+        Returns the width of the text in each column of the table rows the way
+        ExcelOutput.print_class lays them out
+        """
+        rows = []
+        for s in cls.students:
+            address = s.address() or ''
+            guardians = s.guardians if s.guardians else []
+
+            if guardians:
+                g = guardians[0]
+                rows.append((text_width(s.title, bold=True), 0, text_width(g.title()), text_width(g.email or ''), text_width(g.phone or '')))
+            else:
+                rows.append((text_width(s.title, bold=True), 0, 0, 0, 0))
+
+            if len(guardians) > 1:
+                g = guardians[1]
+                rows.append((0, text_width(address), text_width(g.title()), text_width(g.email or ''), text_width(g.phone or '')))
+            elif guardians and address:
+                rows.append((0, text_width(address), 0, 0, 0))
+
+        return rows
+
+    def widths(self, columns, spilled, scale):
+        widths = {}
+        for c, width, heading in zip(COLUMNS, columns, HEADING_WIDTHS):
+            needed = max(to_pixels(width, FONT_SIZE * scale), to_pixels(heading, HEADING_SIZE * scale)) + CELL_PADDING
+            widths[c] = max(math.ceil(needed), round(DEFAULT_WIDTHS[c] * scale))
+
+        # Text that does not wrap overflows into the next column when that cell is empty
+        for c, next_column, width, size in zip(['A', 'B'], ['B', 'C'], spilled, [STUDENT_SIZE, FONT_SIZE]):
+            needed = math.ceil(to_pixels(width, size * scale) + CELL_PADDING)
+            widths[c] += max(0, needed - widths[c] - widths[next_column])
+
+        # Whatever is left goes to the emails which wrap when they do not fit
+        remaining = math.floor(self.available_width) - sum(w for c, w in widths.items() if c != 'D')
+        widths['D'] = min(remaining, widths['D'])
+        return widths
+
+    def row_heights(self, rows, widths, scale):
+        heights = [max(size * LINE_HEIGHT, DEFAULT_ROW_HEIGHT) * scale for size in TITLE_SIZES]
+        heights.append(DEFAULT_ROW_HEIGHT * scale)
+        heights.append(max(HEADING_SIZE * LINE_HEIGHT, DEFAULT_ROW_HEIGHT) * scale)
+
+        email_width = to_pixels(1, FONT_SIZE * scale) / max(widths['D'] - CELL_PADDING, 1)
+        phone_width = to_pixels(1, FONT_SIZE * scale) / max(widths['E'] - CELL_PADDING, 1)
+        for student, _, _, email, phone in rows:
+            lines = max(1, math.ceil(email * email_width), math.ceil(phone * phone_width))
+            size = STUDENT_SIZE if student else FONT_SIZE
+            heights.append(max(size * LINE_HEIGHT, FONT_SIZE * LINE_HEIGHT * lines, DEFAULT_ROW_HEIGHT) * scale)
+        return heights
+
+    def fit(self, cls):
+        rows = PageFitter.measure(cls)
+
+        # Student names always have the empty address cell next to them and
+        # addresses have an empty guardian cell when there is no second guardian
+        columns = [0] + [max((row[i] for row in rows), default=0) for i in range(1, 5)]
+        columns[1] = max((row[1] for row in rows if row[2]), default=0)
+        spilled = [max((row[0] for row in rows), default=0), max((row[1] for row in rows if not row[2]), default=0)]
+
+        for size in FONT_SIZES:
+            scale = size / FONT_SIZE
+            widths = self.widths(columns, spilled, scale)
+            heights = self.row_heights(rows, widths, scale)
+            height = sum(heights)
+            # Emails squeezed into a narrow column wrap into an unreadable column of letters
+            if widths['D'] >= MIN_EMAIL_WIDTH * scale and height <= self.available_height:
+                return PageFit(widths, size, heights, height, fits=True)
+
+        return PageFit(widths, size, heights, height, fits=False)
@@ -0,0 +1,129 @@
+"""
+Renders the class sheets in worker processes. Each worker writes its sheet
+to worksheet XML with its own style table, and the styles are merged into
+the main workbook in the same order the serial render would have added them
+so the saved workbook is identical.
+
+This uses openpyxl internals (WorksheetWriter, the workbook style tables and
+the worksheet relationships) that were verified against openpyxl 3.1.5.
+"""
+import re
+
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.packaging.relationship import Relationship, RelationshipList
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.writer.excel import ExcelWriter
+
+
+# The style id of a cell or row
+STYLE_ID = re.compile(rb'(<(?:c|row) [^>]*?\bs=")(\d+)(")')
+BUILTIN_FORMATS = 164
+
+_data = None
+
+
+def init_worker(data):
+    # The data is sent once per worker rather than with every class
+    global _data
+    _data = data
+
+
+def render_class(index):
+    from phonebook.excel import ExcelOutput
+
+    cls = _data.class_lists[index]
+    output = ExcelOutput(_data, None, pages=False)
+    output.print_class(cls)
+
+    return SheetPart.from_worksheet(output.wb[cls.title()])
+
+
+class SheetPart:
+    """
+    A worksheet written to XML along with the workbook styles its cells refer to
+    """
+
+    def __init__(self, xml, relationships, cell_styles, fonts, fills, borders, alignments, protections, number_formats, named_styles):
+        self.xml = xml
+        self.relationships = relationships
+        self.cell_styles = cell_styles
+        self.fonts = fonts
+        self.fills = fills
+        self.borders = borders
+        self.alignments = alignments
+        self.protections = protections
+        self.number_formats = number_formats
+        self.named_styles = named_styles
+
+    @staticmethod
+    def from_worksheet(ws):
+        writer = WorksheetWriter(ws)
+        writer.write()
+        with open(writer.out, 'rb') as f:
+            xml = f.read()
+        relationships = [(r.Id, r.Type, r.Target, r.TargetMode) for r in writer._rels]
+        writer.cleanup()
+
+        wb = ws.parent
+        return SheetPart(xml, relationships,
+                list(wb._cell_styles), list(wb._fonts), list(wb._fills), list(wb._borders),
+                list(wb._alignments), list(wb._protections), list(wb._number_formats),
+                [s.name for s in wb._named_styles])
+
+    def merge_styles(self, wb):
+        """
+        Adds the fonts, borders, etc. to the workbook the way rendering the sheet would have
+        """
+        # The first of each is the workbook default. It is not looked up since
+        # ExcelOutput changes DEFAULT_FONT after the main workbook added it.
+        self.font_ids = [0] + [wb._fonts.add(f) for f in self.fonts[1:]]
+        self.fill_ids = [0] + [wb._fills.add(f) for f in self.fills[1:]]
+        self.border_ids = [0] + [wb._borders.add(b) for b in self.borders[1:]]
+        self.alignment_ids = [0] + [wb._alignments.add(a) for a in self.alignments[1:]]
+        self.protection_ids = [0] + [wb._protections.add(p) for p in self.protections[1:]]
+        self.number_format_ids = [BUILTIN_FORMATS + wb._number_formats.add(f) for f in self.number_formats]
+        named_styles = wb._named_styles.names
+        self.named_style_ids = [named_styles.index(name) for name in self.named_styles]
+
+    def write(self, wb):
+        """
+        Returns the sheet XML with its style ids replaced by the ids in the
+        workbook, which are assigned as the sheet is written like the serial path
+        """
+        cell_style_ids = []
+        for style in self.cell_styles:
+            style = StyleArray(style)
+            style.fontId = self.font_ids[style.fontId]
+            style.fillId = self.fill_ids[style.fillId]
+            style.borderId = self.border_ids[style.borderId]
+            style.alignmentId = self.alignment_ids[style.alignmentId]
+            style.protectionId = self.protection_ids[style.protectionId]
+            if style.numFmtId >= BUILTIN_FORMATS:
+                style.numFmtId = self.number_format_ids[style.numFmtId - BUILTIN_FORMATS]
+            style.xfId = self.named_style_ids[style.xfId]
+            cell_style_ids.append(wb._cell_styles.add(style))
+
+        return STYLE_ID.sub(lambda m: m.group(1) + str(cell_style_ids[int(m.group(2))]).encode() + m.group(3), self.xml)
+
+
+class PartsExcelWriter(ExcelWriter):
+    """
+    Writes a workbook where some worksheets were already written to XML
+    """
+
+    def __init__(self, workbook, archive, parts):
+        super().__init__(workbook, archive)
+        self.parts = parts
+
+    def write_worksheet(self, ws):
+        part = self.parts.get(ws.title)
+        if part is None:
+            return super().write_worksheet(ws)
+
+        ws._drawing = SpreadsheetDrawing()
+        ws._rels = RelationshipList()
+        for id, type, target, target_mode in part.relationships:
+            ws._rels.append(Relationship(Id=id, Type=type, Target=target, TargetMode=target_mode))
+        self._archive.writestr(ws.path[1:], part.write(self.workbook))
+        self.manifest.append(ws)
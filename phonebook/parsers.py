@@ -0,0 +1,184 @@
+import os
+import re
+
+from phonebook.contacts import normalize_contacts
+from phonebook.model import Class, Grade, Households, Student, Teacher
+
+
+class ParentColumns:
+    """
+    Locates the columns of a parent file by their headers. Columns that cannot
+    be found fall back to where they were in the 2025-2026 files.
+    """
+
+    GUARDIAN_HEADERS = ['guardian name', 'guardian', 'parent/guardian name', 'parent name']
+
+    def __init__(self, header):
+        self.header = [str(h).strip().lower() if h is not None else '' for h in header]
+
+        self.name = self.find(['full name (lf)', 'full name', 'student name', 'student'], default=0)
+        self.grade = self.find(['grade'], default=1)
+        self.teacher = self.find(['homeroom teacher', 'teacher'], default=2)
+        self.guardian = self.find(self.GUARDIAN_HEADERS, default=4)
+        self.email = self.find(['email', 'guardian email'], start=self.guardian, default=5)
+
+        # The second guardian repeats the headers of the first so search after the first guardian
+        self.guardian_2 = self.find(self.GUARDIAN_HEADERS, start=self.email + 1)
+        if self.guardian_2 is not None:
+            self.phone = self.find(['phone', 'guardian phone'], start=self.email + 1, end=self.guardian_2)
+            self.address = self.find(['address', 'family address'], start=self.email + 1, end=self.guardian_2)
+        else:
+            self.phone = self.find(['phone', 'guardian phone'], start=self.email + 1, end=self.email + 2)
+            self.address = self.find(['address', 'family address'], start=self.email + 2, end=self.email + 3)
+
+            if self.address is not None:
+                self.guardian_2 = 10
+            elif self.phone is not None:
+                self.guardian_2 = 7
+            else:
+                self.guardian_2 = 6
+
+        self.email_2 = self.find(['email', 'guardian email'], start=self.guardian_2, default=self.guardian_2 + 1)
+        self.phone_2 = self.find(['phone', 'guardian phone'], start=self.guardian_2, default=self.guardian_2 + 2)
+
+    def find(self, names, start=0, end=None, default=None):
+        end = len(self.header) if end is None else min(end, len(self.header))
+        return next((i for i in range(start, end) if self.header[i] in names), default)
+
+    def fields(self, row):
+        fields = {}
+        for field in ['name', 'grade', 'teacher', 'guardian', 'email', 'phone', 'address', 'guardian_2', 'email_2', 'phone_2']:
+            index = getattr(self, field)
+            value = row[index] if index is not None and index < len(row) else None
+            # CSV files have empty strings rather than empty cells
+            fields[field] = value if value != '' else None
+        return fields
+
+class ParentParser:
+    @staticmethod
+    def parse_parent_students(parent_files, households=None, problems=None):
+        return ParentParser.parse_students([ParentParser.read_parent_file(f) for f in parent_files], households, problems)
+
+    @staticmethod
+    def parse_students(parent_file_fields, households=None, problems=None):
+        """
+        Creates the students from the fields already read from each parent file
+        and cleans up the contact fields of their guardians. The contact problems
+        found are added to problems when it is given.
+        """
+        households = households if households is not None else Households()
+        students = [Student.parse_from_parent_file(fields, households) for file_fields in parent_file_fields for fields in file_fields]
+
+        # Only once every file is merged since each file fills in fields the others are missing
+        found = normalize_contacts(households.guardians)
+        if problems is not None:
+            problems.extend(found)
+        return students
+
+    @staticmethod
+    def read_parent_file(f):
+        rows = ParentParser.read_rows(f)
+        columns = ParentColumns(next(rows, []))
+
+        file_fields = []
+        for row in rows:
+            fields = columns.fields(row)
+            if fields['name'] is None:
+                continue
+            file_fields.append(fields)
+        return file_fields
+
+    @staticmethod
+    def read_rows(f):
+        """
+        Yields the rows of a parent file as lists of values with the header first
+        """
+        match os.path.splitext(str(f))[1].lower():
+            case '.csv':
+                return ParentParser.__read_csv(f)
+            case '.parquet':
+                return ParentParser.__read_parquet(f)
+            case _:
+                return ParentParser.__read_xlsx(f)
+
+    @staticmethod
+    def __read_xlsx(f):
+        import openpyxl
+
+        wb = openpyxl.load_workbook(f, read_only=True)
+        try:
+            yield from wb.active.iter_rows(values_only=True)
+        finally:
+            wb.close()
+
+    @staticmethod
+    def __read_csv(f):
+        import csv
+
+        # utf-8-sig drops the byte order mark that spreadsheet exports add
+        with open(f, newline='', encoding='utf-8-sig') as csv_file:
+            yield from csv.reader(csv_file)
+
+    @staticmethod
+    def __read_parquet(f):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(f)
+        yield parquet_file.schema_arrow.names
+        # The columns are read by position since the guardian headers repeat
+        for batch in parquet_file.iter_batches():
+            yield from (list(row) for row in zip(*(column.to_pylist() for column in batch.columns)))
+
+class ClassListParser:
+    @staticmethod
+    def parse_class(title, rows):
+        teacher_name = re.sub(r" \(.*\)$", "", rows[0][0].upper().replace('TEACHER: ', '').strip())
+        # Transform Kdg, 1st, 2nd, 3rd, 4th, 5th => K, 1, 2, 3, 4, 5
+        grade = Grade(rows[0][1])
+        room = rows[0][2]
+
+        if teacher_name != title:
+            raise Exception(f"Expected teacher name {teacher_name} to match sheet title {title}")
+
+        teacher = Teacher(teacher_name, grade)
+        students = ClassListParser.parse_students(teacher, rows[3:])
+
+        return Class(room, teacher, grade, students)
+
+    @staticmethod
+    def parse_students(teacher, rows):
+        students = []
+        for row in rows:
+            if not row or row[0] is None or "total" in row[0].lower():
+                break
+
+            s = Student(name=row[0], grade=teacher.grade, teacher=teacher)
+            students.append(s)
+        return students
+
+    @staticmethod
+    def parse_lists(class_list):
+        return ClassListParser.parse_sheets(ClassListParser.read_sheets(class_list))
+
+    @staticmethod
+    def parse_sheets(sheets):
+        return [ClassListParser.parse_class(title, rows) for title, rows in sheets]
+
+    @staticmethod
+    def read_sheets(class_list):
+        """
+        Returns the title and rows of values of each class sheet in the class list
+        """
+        import openpyxl
+
+        wb = openpyxl.load_workbook(class_list, read_only=True)
+
+        sheets = []
+        for sheet in wb.worksheets:
+            if sheet.title.startswith("Sheet"):
+                continue
+
+            sheets.append((sheet.title, list(sheet.iter_rows(values_only=True))))
+
+        wb.close()
+        return sheets
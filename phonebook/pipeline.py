@@ -0,0 +1,43 @@
+from phonebook.contacts import report_problems
+from phonebook.model import AllData, Households
+from phonebook.parsers import ClassListParser, ParentParser
+
+
+def load_data(class_list, parent_files):
+    return build_data(ClassListParser.read_sheets(class_list), [ParentParser.read_parent_file(f) for f in parent_files])
+
+
+def build_data(class_sheets, parent_file_fields):
+    """
+    Merges the rows already read from the class list and parent files
+    """
+    class_lists = ClassListParser.parse_sheets(class_sheets)
+    households = Households()
+    problems = []
+    students = ParentParser.parse_students(parent_file_fields, households, problems)
+    report_problems(problems)
+
+    return AllData(class_lists, students, households)
+
+
+def create_output(data, fmt='excel', output=None, workers=None, compression='default'):
+    # The output modules are imported here so openpyxl is only loaded when it is needed
+    match fmt:
+        case 'excel':
+            from phonebook.excel import ExcelOutput
+            return ExcelOutput(data, output, workers=workers, compression=compression)
+        case 'shards':
+            from phonebook.shards import ShardOutput
+            return ShardOutput(data, output, workers=workers, compression=compression)
+        case 'text':
+            from phonebook.text import TextOutput
+            return TextOutput()
+        case _:
+            raise ValueError(f"Unknown output format {fmt}")
+
+
+def render(data, outputs):
+    for output in outputs:
+        for c in data.class_lists:
+            output.print_class(c)
+        output.finish(data)
@@ -0,0 +1,60 @@
+"""
+Writes a small workbook for each class with its class list and the part of the
+student index for its students, so room parents can share their own page.
+"""
+import os
+
+from phonebook import parallel
+from phonebook.excel import ExcelOutput
+
+
+def write_class_book(data, cls, path, compression='default'):
+    output = ExcelOutput(data, path, pages=False, compression=compression)
+    output.print_class(cls)
+    output.finish_class_book(data, cls)
+    return path
+
+
+def write_class_book_in_worker(index, path, compression):
+    # The data was sent to the worker by parallel.init_worker
+    data = parallel._data
+    return write_class_book(data, data.class_lists[index], path, compression)
+
+
+class ShardOutput:
+    """
+    Writes one workbook per class into a directory, in worker processes when
+    workers is given
+    """
+
+    def __init__(self, data, directory, workers=None, compression='default'):
+        self.data = data
+        self.directory = directory
+        self.workers = workers
+        self.compression = compression
+        self.pool = None
+        self.books = []
+
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, cls):
+        return os.path.join(self.directory, f"{cls.title()}.xlsx")
+
+    def print_class(self, cls):
+        if not self.workers:
+            self.books.append(write_class_book(self.data, cls, self.path(cls), self.compression))
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=parallel.init_worker, initargs=(self.data,))
+        self.books.append(self.pool.submit(write_class_book_in_worker, self.data.class_lists.index(cls), self.path(cls), self.compression))
+
+    def finish(self, data):
+        if self.pool:
+            self.books = [future.result() for future in self.books]
+            self.pool.shutdown()
+            self.pool = None
+
+        print(f"Wrote {len(self.books)} class books to {self.directory}")
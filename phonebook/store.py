@@ -0,0 +1,163 @@
+"""
+A content-addressed store of build artifacts. A build is keyed by the hashes
+of its input files and settings. When the key has been built before, its
+artifacts are copied back from the store instead of building them again.
+
+Also runs the build.sh steps so they are skipped when nothing changed:
+
+    python3 -m phonebook.store --store DIR --input a.jpg --output a.pdf -- img2pdf a.jpg -o a.pdf
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+from pathlib import Path
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+# The code and artwork that go into the workbook, so changing them rebuilds it
+SOURCE_FILES = sorted([*PACKAGE_DIR.glob('*.py'), *(p for p in (PACKAGE_DIR.parent / 'images').iterdir() if p.is_file())])
+
+
+class ArtifactStore:
+    def __init__(self, directory):
+        self.directory = directory
+
+    @staticmethod
+    def hash_file(path):
+        with open(path, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+    @staticmethod
+    def key(inputs, settings):
+        key = hashlib.sha256(json.dumps(settings, sort_keys=True).encode())
+        for path in inputs:
+            key.update(ArtifactStore.hash_file(path).encode())
+        return key.hexdigest()
+
+    def object_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest[:2], digest)
+
+    def build_path(self, key):
+        return os.path.join(self.directory, 'builds', f"{key}.json")
+
+    def last_path(self):
+        return os.path.join(self.directory, 'last.json')
+
+    @staticmethod
+    def write_json(path, value):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(value, f, indent=2, sort_keys=True)
+        os.replace(f"{path}.tmp", path)
+
+    @staticmethod
+    def copy(source, destination):
+        # Copy beside the destination first so a reader never sees half a file
+        shutil.copyfile(source, f"{destination}.tmp")
+        os.replace(f"{destination}.tmp", destination)
+
+    def lookup(self, key):
+        """
+        Returns the digests of the artifacts built for the key by path, or None
+        when the key has not been built
+        """
+        try:
+            with open(self.build_path(key)) as f:
+                artifacts = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if all(os.path.exists(self.object_path(digest)) for digest in artifacts.values()):
+            return artifacts
+        return None
+
+    def restore(self, artifacts):
+        for path, digest in artifacts.items():
+            # Leave identical files alone so their modification times do not change
+            if os.path.exists(path) and ArtifactStore.hash_file(path) == digest:
+                continue
+            ArtifactStore.copy(self.object_path(digest), path)
+
+    def add(self, key, paths):
+        artifacts = {}
+        for path in paths:
+            digest = ArtifactStore.hash_file(path)
+            destination = self.object_path(digest)
+            if not os.path.exists(destination):
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                ArtifactStore.copy(path, destination)
+            artifacts[path] = digest
+
+        ArtifactStore.write_json(self.build_path(key), artifacts)
+        return artifacts
+
+    def report(self, artifacts, restored):
+        """
+        Prints whether each artifact differs from the last time it was built
+        and returns the paths of those that do
+        """
+        try:
+            with open(self.last_path()) as f:
+                last = json.load(f)
+        except FileNotFoundError:
+            last = {}
+
+        changed = []
+        for path, digest in artifacts.items():
+            previous = last.get(os.path.abspath(path))
+            if previous == digest:
+                status = 'unchanged'
+            else:
+                status = 'new' if previous is None else 'changed'
+                changed.append(path)
+            source = 'from store' if restored else 'built'
+            print(f"{path}: {status} ({source}, sha256 {digest[:12]})")
+            last[os.path.abspath(path)] = digest
+
+        ArtifactStore.write_json(self.last_path(), last)
+        return changed
+
+    def build(self, inputs, settings, outputs, build):
+        """
+        Restores the outputs when the inputs and settings were built before and
+        otherwise calls build and stores them. Returns the paths that changed.
+        """
+        key = ArtifactStore.key(inputs, settings)
+        artifacts = self.lookup(key)
+        if artifacts is not None:
+            self.restore(artifacts)
+            return self.report(artifacts, restored=True)
+
+        build()
+        return self.report(self.add(key, outputs), restored=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python3 -m phonebook.store', usage='%(prog)s [options] -- command')
+    parser.add_argument('--store', required=True, help='the artifact store directory')
+    parser.add_argument('--input', action='append', default=[], help='a file the command reads')
+    parser.add_argument('--output', action='append', required=True, help='a file the command writes')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='the command to run')
+
+    args = parser.parse_args(argv)
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        parser.error('a command is required')
+
+    settings = {'command': command, 'source_date_epoch': os.environ.get('SOURCE_DATE_EPOCH')}
+    try:
+        ArtifactStore(args.store).build(args.input, settings, args.output,
+                lambda: subprocess.run(command, check=True))
+    except subprocess.CalledProcessError as e:
+        # The command already printed why it failed and nothing was stored
+        return e.returncode
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+from phonebook.model import Guardian
+
+
+class TextOutput:
+
+    blank_guardian = Guardian(name='', email='', phone='', address='')
+
+    def print_class(self, cls):
+        print(cls.teacher.title)
+        print(f"{cls.grade.pretty()} - {cls.room}")
+
+        for s in cls.students:
+            address = s.address() or ''
+            guardians = s.guardians
+            if guardians:
+                guardian1 = guardians[0]
+                guardian2 = guardians[1] if len(guardians) > 1 else self.blank_guardian
+            else:
+                guardian1 = guardian2 = self.blank_guardian
+
+            print(f"{s.title:30} {guardian1.title():30} {guardian1.email or '':30} {guardian1.phone if guardian1.phone else '':12}")
+            if address:
+                print(f"{"":4} {address:25} {guardian2.title():30} {guardian2.email or '':30} {str(guardian2.phone):12}")
+        print("\n\n")
+
+    def finish(self, data):
+        for letter, students in data.student_index():
+            print(f"{letter}:")
+            for s in students:
+                print(f"  {s.index_name:30} {s.grade} {s.teacher}")
+            print("")
@@ -0,0 +1,98 @@
+import os
+import time
+
+from phonebook.parsers import ClassListParser, ParentParser
+from phonebook.pipeline import build_data, create_output, render
+
+
+class Watcher:
+    """
+    Keeps the rows read from each input file in memory and rebuilds the output
+    whenever one of the files changes, re-reading only the files that changed
+    """
+
+    def __init__(self, class_list, parent_files, fmt='excel', output=None, workers=None, compression='default', interval=0.5, debounce=1.0):
+        self.class_list = class_list
+        self.parent_files = parent_files
+        self.fmt = fmt
+        self.output = output
+        self.workers = workers
+        self.compression = compression
+        self.interval = interval
+        self.debounce = debounce
+
+        self.class_sheets = None
+        self.parent_file_fields = {}
+        self.mtimes = {}
+
+    def files(self):
+        return [self.class_list, *self.parent_files]
+
+    @staticmethod
+    def mtime(f):
+        try:
+            return os.stat(f).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def snapshot(self):
+        return {f: Watcher.mtime(f) for f in self.files()}
+
+    def build(self, changed):
+        start = time.perf_counter()
+        class_sheets = ClassListParser.read_sheets(self.class_list) if self.class_list in changed else self.class_sheets
+        parent_file_fields = {f: ParentParser.read_parent_file(f) if f in changed else self.parent_file_fields[f] for f in self.parent_files}
+        read = time.perf_counter()
+
+        data = build_data(class_sheets, [parent_file_fields[f] for f in self.parent_files])
+        merged = time.perf_counter()
+
+        # Only keep the new rows once they merge so a bad file does not replace the last good data
+        self.class_sheets = class_sheets
+        self.parent_file_fields = parent_file_fields
+
+        render(data, [create_output(data, self.fmt, self.output, self.workers, self.compression)])
+        rendered = time.perf_counter()
+
+        print(f"Rebuilt {self.output or 'output'} in {(rendered - start) * 1000:.0f} ms "
+              f"(read {len(changed)} file(s) {(read - start) * 1000:.0f} ms, "
+              f"merge {(merged - read) * 1000:.0f} ms, render {(rendered - merged) * 1000:.0f} ms)")
+
+    def wait_for_changes(self):
+        while True:
+            current = self.snapshot()
+            if current != self.mtimes:
+                break
+            time.sleep(self.interval)
+
+        # Spreadsheet programs and downloads write files in several steps so wait until they settle
+        while True:
+            time.sleep(self.debounce)
+            settled = self.snapshot()
+            if settled == current and None not in settled.values():
+                return settled
+            current = settled
+
+    def try_build(self, changed):
+        try:
+            self.build(changed)
+            return []
+        except Exception as e:
+            # Keep the last good data and wait for the file to be fixed
+            print(f"ERROR: Failed to rebuild: {e!r}")
+            return changed
+
+    def run(self):
+        self.mtimes = self.snapshot()
+        # A file may be mid-save when watching starts so this can fail like any rebuild
+        failed = self.try_build(self.files())
+
+        print(f"Watching {len(self.files())} files for changes. Press Ctrl-C to stop.")
+        while True:
+            settled = self.wait_for_changes()
+            changed = [f for f in self.files() if settled[f] != self.mtimes.get(f)]
+            self.mtimes = settled
+
+            print(f"Changed: {', '.join(os.path.basename(f) for f in changed)}")
+            # The files read by a failed build were not kept so they are read again
+            failed = self.try_build([f for f in self.files() if f in changed or f in failed])
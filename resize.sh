@@ -1,15 +1,22 @@
 #!/usr/bin/env bash
 
-mkdir -p covers/resized
+# Resize the covers and pick the lowest JPEG quality for each that still looks
+# the same. Pass the PDF of the class lists to check the whole book fits the
+# budget before running build.sh. Any options after it, like --floor 40, are
+# passed on to phonebook.images.
+options=()
+if [[ -n "${1:-}" && "$1" != -* ]]; then
+  options+=(--data-pdf "$1")
+  shift
+fi
 
-# Turn the covers to PDFs
-for img in \
+python3 -m phonebook.images \
+  --max-size 2480x3508 \
+  --budget "${BOOK_BUDGET:-20M}" \
+  "${options[@]}" \
+  "$@" \
+  --output-dir covers \
   covers/modified/front-cover.jpg \
   covers/modified/front-inside-cover.jpg \
   covers/modified/back-inside-cover.jpg \
-  covers/modified/back-cover.jpg \
-  ; do
-  echo "Resizing $img..."
-  b="$(basename "$img" .jpg)"
-  convert "$img" -resize 2480x3508 -quality 85 covers/"$b".jpg
-done
+  covers/modified/back-cover.jpg